@@ -4,14 +4,123 @@ Diagnostics tool for Five in a Row (Gomoku) game.
 This script helps diagnose and fix common issues with the game installation.
 """
 
+import io
+import importlib.util
 import os
 import sys
 import platform
 import subprocess
-import shutil
-import ctypes
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
+# The platform can't change while the script runs, so look it up once
+_SYSTEM = platform.system()
+_IS_WINDOWS = _SYSTEM == "Windows"
+_IS_DARWIN = _SYSTEM == "Darwin"
+
+# Name of the C++ backend library on this platform
+if _IS_WINDOWS:
+    _LIB_NAME = "gomoku.dll"
+elif _IS_DARWIN:  # macOS
+    _LIB_NAME = "libgomoku.dylib"
+else:  # Linux
+    _LIB_NAME = "libgomoku.so"
+
+# Project layout, resolved once instead of in every function
+PROJECT_ROOT = os.path.dirname(os.path.abspath(__file__))
+BUILD_DIR = os.path.join(PROJECT_ROOT, "build")
+LIB_DIR = os.path.join(PROJECT_ROOT, "lib")
+SRC_FRONTEND = os.path.join(PROJECT_ROOT, "src", "frontend")
+
+def list_directory(path):
+    """Return the set of entry names in a directory, or an empty set if it can't be read.
+    
+    Broken symbolic links are left out, matching what os.path.exists reports.
+    """
+    try:
+        with os.scandir(path) as entries:
+            return {entry.name for entry in entries
+                    if not entry.is_symlink() or os.path.exists(entry.path)}
+    except OSError:
+        return set()
+
+def find_first_existing(paths, listings=None):
+    """Return the first of the given paths that exists, or None.
+    
+    Each parent directory is listed once with os.scandir and the result is kept
+    in `listings`, so checking many candidates costs one syscall per directory
+    instead of one stat per path.
+    """
+    if listings is None:
+        listings = {}
+    for path in paths:
+        parent, name = os.path.split(path)
+        if parent not in listings:
+            listings[parent] = list_directory(parent)
+        if name in listings[parent]:
+            return path
+    return None
+
+class ThreadLocalOutput:
+    """Stand-in for sys.stdout that sends each thread's output to its own buffer."""
+    
+    def __init__(self, stream):
+        self.stream = stream
+        self.local = threading.local()
+    
+    def capture(self):
+        """Start buffering output written by the calling thread."""
+        self.local.buffer = io.StringIO()
+        return self.local.buffer
+    
+    def release(self):
+        """Stop buffering output written by the calling thread."""
+        self.local.buffer = None
+    
+    def write(self, text):
+        buffer = getattr(self.local, 'buffer', None)
+        return (buffer or self.stream).write(text)
+    
+    def flush(self):
+        self.stream.flush()
+
+def run_checks_concurrently(checks):
+    """Run independent check functions in parallel and return their results in order.
+    
+    Every check prints while it runs, so output is buffered per thread and
+    written out in the order the checks were given once they have all finished.
+    """
+    output = ThreadLocalOutput(sys.stdout)
+    
+    def run_buffered(check):
+        buffer = output.capture()
+        try:
+            return check(), buffer.getvalue()
+        finally:
+            output.release()
+    
+    sys.stdout = output
+    try:
+        with ThreadPoolExecutor(max_workers=len(checks)) as executor:
+            futures = [executor.submit(run_buffered, check) for check in checks]
+            outcomes = [future.result() for future in futures]
+    finally:
+        sys.stdout = output.stream
+    
+    results = []
+    for result, text in outcomes:
+        sys.stdout.write(text)
+        results.append(result)
+    return results
+
+# Packages whose import name differs from their name on PyPI
+_IMPORT_NAMES = {'pillow': 'PIL'}
+
+def is_package_installed(package):
+    """Check whether a package can be imported, without actually importing it."""
+    return importlib.util.find_spec(_IMPORT_NAMES.get(package, package)) is not None
+
 def check_python_version():
     """Check if the Python version is compatible."""
     print("Checking Python version...")
@@ -33,10 +142,9 @@ def check_required_packages():
     missing = []
     
     for package in required_packages:
-        try:
-            __import__(package)
+        if is_package_installed(package):
             print(f"  [OK] {package} is installed")
-        except ImportError:
+        else:
             print(f"  [MISSING] {package} is not installed")
             missing.append(package)
     
@@ -50,47 +158,38 @@ def check_library():
     """Check if the C++ library is properly built and accessible."""
     print("Checking C++ backend library...")
     
-    # Get project root
-    project_root = os.path.dirname(os.path.abspath(__file__))
-    
-    # Define the library filename based on the platform
-    if platform.system() == "Windows":
-        lib_name = "gomoku.dll"
-    elif platform.system() == "Darwin":  # macOS
-        lib_name = "libgomoku.dylib"
-    else:  # Linux
-        lib_name = "libgomoku.so"
+    build_dir = Path(BUILD_DIR)
     
     # Check in standard locations
     locations = [
-        os.path.join(project_root, "lib", lib_name),
-        os.path.join(project_root, "build", lib_name),
+        Path(LIB_DIR) / _LIB_NAME,
+        build_dir / _LIB_NAME,
     ]
     
     # Add platform-specific locations
-    if platform.system() == "Windows":
-        locations.append(os.path.join(project_root, "build", "Release", lib_name))
-    
-    found_lib = None
-    for loc in locations:
-        if os.path.exists(loc):
-            found_lib = loc
-            print(f"  [OK] Library found at: {loc}")
-            break
+    if _IS_WINDOWS:
+        locations.append(build_dir / "Release" / _LIB_NAME)
     
-    if not found_lib:
+    found_lib = find_first_existing(locations)
+    if found_lib:
+        print(f"  [OK] Library found at: {found_lib}")
+    else:
         print(f"  [MISSING] Library not found in any standard location")
         print("\nThe C++ backend library is missing. You need to build it:")
-        if platform.system() == "Windows":
+        if _IS_WINDOWS:
             print("  build.bat")
         else:
             print("  ./build.sh")
         return False
     
-    # Try to load the library
+    # Try to load the library (ctypes is only needed for this check)
+    import ctypes
     try:
         print(f"  Attempting to load library from: {found_lib}")
-        lib = ctypes.CDLL(found_lib)
+        # Bind symbols lazily: we only probe a few exports, each looked up on demand
+        # (os.RTLD_LAZY doesn't exist on Windows, where the mode is ignored anyway)
+        load_mode = ctypes.DEFAULT_MODE | getattr(os, 'RTLD_LAZY', 0)
+        lib = ctypes.CDLL(os.fspath(found_lib), mode=load_mode)
         print(f"  [OK] Successfully loaded the library")
         
         # Check if the library has the expected functions
@@ -121,9 +220,6 @@ def check_resources():
     """Check if all required resources are available."""
     print("Checking resources...")
     
-    # Get project root
-    project_root = os.path.dirname(os.path.abspath(__file__))
-    
     # Define required resources
     required_resources = [
         'gomoku_icon.png'
@@ -131,19 +227,16 @@ def check_resources():
     
     # Check multiple possible resource locations
     resource_locations = [
-        os.path.join(project_root, 'resources'),
-        os.path.join(project_root, 'src', 'resources')
+        os.path.join(PROJECT_ROOT, 'resources'),
+        os.path.join(PROJECT_ROOT, 'src', 'resources')
     ]
     
+    # Each resource directory is listed once and shared across all lookups
+    listings = {}
     resource_status = {}
     for resource in required_resources:
-        resource_status[resource] = None
-        
-        for location in resource_locations:
-            path = os.path.join(location, resource)
-            if os.path.exists(path):
-                resource_status[resource] = path
-                break
+        candidates = [os.path.join(location, resource) for location in resource_locations]
+        resource_status[resource] = find_first_existing(candidates, listings)
     
     # Print status
     all_found = True
@@ -166,33 +259,38 @@ def check_file_permissions():
     print("Checking file permissions...")
     
     # Only relevant on Unix-like systems
-    if platform.system() == "Windows":
+    if _IS_WINDOWS:
         print("  [SKIPPED] Permissions check not applicable on Windows")
         return True
     
-    # Get project root
-    project_root = os.path.dirname(os.path.abspath(__file__))
-    
     # Files that need to be executable
     executable_files = [
-        os.path.join(project_root, "build.sh"),
-        os.path.join(project_root, "play_gomoku.sh"),
-        os.path.join(project_root, "play_gomoku.py"),
-        os.path.join(project_root, "src", "frontend", "setup_resources.py"),
-        os.path.join(project_root, "src", "frontend", "gomoku_app.py"),
-        os.path.join(project_root, "src", "frontend", "create_icon.py"),
+        os.path.join(PROJECT_ROOT, "build.sh"),
+        os.path.join(PROJECT_ROOT, "play_gomoku.sh"),
+        os.path.join(PROJECT_ROOT, "play_gomoku.py"),
+        os.path.join(SRC_FRONTEND, "setup_resources.py"),
+        os.path.join(SRC_FRONTEND, "gomoku_app.py"),
+        os.path.join(SRC_FRONTEND, "create_icon.py"),
     ]
     
     all_ok = True
     for file_path in executable_files:
-        if os.path.exists(file_path):
-            if os.access(file_path, os.X_OK):
-                print(f"  [OK] {os.path.basename(file_path)} is executable")
-            else:
-                print(f"  [WARNING] {os.path.basename(file_path)} is not executable")
-                all_ok = False
-        else:
+        # A single stat gives us both existence and the executable bit
+        try:
+            st = os.stat(file_path)
+        except FileNotFoundError:
             print(f"  [MISSING] {os.path.basename(file_path)} does not exist")
+            continue
+        except OSError as e:
+            print(f"  [MISSING] {os.path.basename(file_path)} could not be checked: {e.strerror}")
+            continue
+        
+        # Any execute bit (user, group or other) counts
+        if st.st_mode & 0o111:
+            print(f"  [OK] {os.path.basename(file_path)} is executable")
+        else:
+            print(f"  [WARNING] {os.path.basename(file_path)} is not executable")
+            all_ok = False
     
     if not all_ok:
         print("\nSome script files are not executable. Fix this with:")
@@ -205,45 +303,41 @@ def fix_permissions():
     """Fix permissions on script files."""
     print("Fixing file permissions...")
     
-    if platform.system() == "Windows":
+    if _IS_WINDOWS:
         print("  [SKIPPED] Permission fixing not applicable on Windows")
         return
     
-    # Get project root
-    project_root = os.path.dirname(os.path.abspath(__file__))
-    
     # Files that need to be executable
     executable_files = [
-        os.path.join(project_root, "build.sh"),
-        os.path.join(project_root, "play_gomoku.sh"),
-        os.path.join(project_root, "play_gomoku.py"),
-        os.path.join(project_root, "src", "frontend", "setup_resources.py"),
-        os.path.join(project_root, "src", "frontend", "gomoku_app.py"),
-        os.path.join(project_root, "src", "frontend", "create_icon.py"),
+        os.path.join(PROJECT_ROOT, "build.sh"),
+        os.path.join(PROJECT_ROOT, "play_gomoku.sh"),
+        os.path.join(PROJECT_ROOT, "play_gomoku.py"),
+        os.path.join(SRC_FRONTEND, "setup_resources.py"),
+        os.path.join(SRC_FRONTEND, "gomoku_app.py"),
+        os.path.join(SRC_FRONTEND, "create_icon.py"),
     ]
     
     for file_path in executable_files:
-        if os.path.exists(file_path):
-            try:
-                os.chmod(file_path, 0o755)  # rwxr-xr-x
-                print(f"  [FIXED] Made {os.path.basename(file_path)} executable")
-            except Exception as e:
-                print(f"  [ERROR] Could not fix permissions on {os.path.basename(file_path)}: {e}")
+        # chmod reports a missing file itself, so there's no need to stat first
+        try:
+            os.chmod(file_path, 0o755)  # rwxr-xr-x
+            print(f"  [FIXED] Made {os.path.basename(file_path)} executable")
+        except FileNotFoundError:
+            continue
+        except Exception as e:
+            print(f"  [ERROR] Could not fix permissions on {os.path.basename(file_path)}: {e}")
 
 def rebuild_library():
     """Rebuild the C++ library."""
     print("Rebuilding C++ library...")
     
-    # Get project root
-    project_root = os.path.dirname(os.path.abspath(__file__))
-    
     # Make sure build and lib directories exist
-    os.makedirs(os.path.join(project_root, "build"), exist_ok=True)
-    os.makedirs(os.path.join(project_root, "lib"), exist_ok=True)
+    os.makedirs(BUILD_DIR, exist_ok=True)
+    os.makedirs(LIB_DIR, exist_ok=True)
     
     # Run the appropriate build script
-    if platform.system() == "Windows":
-        bat_file = os.path.join(project_root, "build.bat")
+    if _IS_WINDOWS:
+        bat_file = os.path.join(PROJECT_ROOT, "build.bat")
         if os.path.exists(bat_file):
             print("  Running build.bat...")
             try:
@@ -254,7 +348,7 @@ def rebuild_library():
         else:
             print("  [ERROR] build.bat not found")
     else:
-        sh_file = os.path.join(project_root, "build.sh")
+        sh_file = os.path.join(PROJECT_ROOT, "build.sh")
         if os.path.exists(sh_file):
             print("  Running build.sh...")
             try:
@@ -271,15 +365,13 @@ def regenerate_resources():
     """Regenerate all game resources."""
     print("Regenerating game resources...")
     
-    # Get project root and resource script path
-    project_root = os.path.dirname(os.path.abspath(__file__))
-    setup_script = os.path.join(project_root, "src", "frontend", "setup_resources.py")
+    setup_script = os.path.join(SRC_FRONTEND, "setup_resources.py")
     
     if os.path.exists(setup_script):
         print("  Running setup_resources.py...")
         try:
             # Make sure the script is executable
-            if platform.system() != "Windows":
+            if not _IS_WINDOWS:
                 os.chmod(setup_script, 0o755)
             
             subprocess.run([sys.executable, setup_script], check=True)
@@ -289,27 +381,31 @@ def regenerate_resources():
     else:
         print("  [ERROR] setup_resources.py not found")
 
+def write_lines(lines):
+    """Write a block of lines to stdout in one call rather than one print per line."""
+    sys.stdout.write("\n".join(lines) + "\n")
+
 def run_full_test():
     """Run a full diagnostic test and fix issues if requested."""
-    print("=" * 60)
-    print("Five in a Row (Gomoku) - Diagnostic Tool")
-    print("=" * 60)
-    print(f"System: {platform.system()} {platform.release()}")
-    print(f"Python: {platform.python_version()}")
-    print("=" * 60)
-    
-    # Run all checks
-    python_ok = check_python_version()
-    packages_ok = check_required_packages()
-    library_ok = check_library()
-    resources_ok = check_resources()
-    permissions_ok = check_file_permissions()
+    write_lines([
+        "=" * 60,
+        "Five in a Row (Gomoku) - Diagnostic Tool",
+        "=" * 60,
+        f"System: {_SYSTEM} {platform.release()}",
+        f"Python: {platform.python_version()}",
+        "=" * 60,
+    ])
+    
+    # Run all checks (they are independent, so run them side by side)
+    python_ok, packages_ok, library_ok, resources_ok, permissions_ok = run_checks_concurrently([
+        check_python_version,
+        check_required_packages,
+        check_library,
+        check_resources,
+        check_file_permissions,
+    ])
     
     # Summarize issues
-    print("\n" + "=" * 60)
-    print("Diagnostic Summary")
-    print("=" * 60)
-    
     issues = []
     if not python_ok:
         issues.append("Python version below recommended (3.6+)")
@@ -322,29 +418,31 @@ def run_full_test():
     if not permissions_ok:
         issues.append("Incorrect file permissions")
     
+    summary = ["", "=" * 60, "Diagnostic Summary", "=" * 60]
     if not issues:
-        print("No issues detected! The game should work correctly.")
+        summary.append("No issues detected! The game should work correctly.")
+        write_lines(summary)
     else:
-        print("The following issues were detected:")
-        for i, issue in enumerate(issues):
-            print(f"  {i+1}. {issue}")
+        summary.append("The following issues were detected:")
+        summary.extend(f"  {i+1}. {issue}" for i, issue in enumerate(issues))
+        write_lines(summary)
         
         # Ask user if they want to fix the issues
         fix_it = input("\nWould you like to attempt to fix these issues? (y/n): ").lower().strip()
         
         if fix_it == 'y':
-            print("\n" + "=" * 60)
-            print("Fixing Issues")
-            print("=" * 60)
+            write_lines(["", "=" * 60, "Fixing Issues", "=" * 60])
             
             if not packages_ok:
                 print("\nInstalling missing Python packages...")
-                for package in ['PyQt5', 'pillow', 'scipy']:
-                    try:
-                        __import__(package)
-                    except ImportError:
-                        print(f"  Installing {package}...")
-                        subprocess.run([sys.executable, "-m", "pip", "install", package], check=False)
+                missing_packages = [package for package in ['PyQt5', 'pillow', 'scipy']
+                                    if not is_package_installed(package)]
+                
+                # Install everything that is missing with a single pip run
+                if missing_packages:
+                    print(f"  Installing {', '.join(missing_packages)}...")
+                    subprocess.run([sys.executable, "-m", "pip", "install", "--disable-pip-version-check",
+                                    *missing_packages], check=False)
             
             if not permissions_ok:
                 print("\nFixing file permissions...")
@@ -8,8 +8,19 @@ import os
 import sys
 import platform
 import subprocess
-import shutil
-import argparse
+import functools
+from pathlib import Path
+
+# The platform can't change while the installer runs, so look it up once
+_SYSTEM = platform.system()
+_IS_WINDOWS = _SYSTEM == "Windows"
+_IS_DARWIN = _SYSTEM == "Darwin"
+
+# Project layout, resolved once instead of in every function
+PROJECT_ROOT = os.path.dirname(os.path.abspath(__file__))
+BUILD_DIR = os.path.join(PROJECT_ROOT, 'build')
+LIB_DIR = os.path.join(PROJECT_ROOT, 'lib')
+SRC_FRONTEND = os.path.join(PROJECT_ROOT, 'src', 'frontend')
 
 def print_section(title):
     """Print a section title in a formatted way."""
@@ -17,66 +28,69 @@ def print_section(title):
     print(f"  {title}")
     print("=" * 50)
 
-def run_command(command, cwd=None):
-    """Run a command and print its output."""
-    print(f"> {command}")
+def run_command(argv, cwd=None):
+    """Run a command (given as an argument list), streaming its output live."""
+    print(f"> {' '.join(argv)}")
+    # Flush first so our own output stays ahead of the child's
+    sys.stdout.flush()
     try:
-        result = subprocess.run(command, shell=True, check=True, cwd=cwd, 
-                               stdout=subprocess.PIPE, stderr=subprocess.PIPE,
-                               universal_newlines=True)
-        if result.stdout:
-            print(result.stdout)
+        # The child inherits our stdout/stderr, so its output appears as it runs
+        subprocess.run(argv, shell=False, check=True, cwd=cwd)
         return True
     except subprocess.CalledProcessError as e:
         print(f"Command failed with exit code {e.returncode}")
-        print(f"Error output: {e.stderr}")
+        return False
+    except OSError as e:
+        # Without a shell, a missing executable surfaces here instead
+        print(f"Could not run {argv[0]}: {e}")
         return False
 
-def get_project_root():
-    """Get the project root directory."""
-    return os.path.dirname(os.path.abspath(__file__))
+@functools.lru_cache(maxsize=None)
+def _which(name):
+    """Look up an executable on PATH, remembering the answer for later calls."""
+    import shutil
+    return shutil.which(name)
 
 def build_backend():
     """Build the C++ backend for the current platform."""
     print_section("Building C++ Backend")
     
-    # Get project root
-    project_root = get_project_root()
-    print(f"Project root: {project_root}")
+    print(f"Project root: {PROJECT_ROOT}")
     
     # Create build and lib directories if they don't exist
-    build_dir = os.path.join(project_root, 'build')
-    lib_dir = os.path.join(project_root, 'lib')
-    
-    os.makedirs(build_dir, exist_ok=True)
-    os.makedirs(lib_dir, exist_ok=True)
+    os.makedirs(BUILD_DIR, exist_ok=True)
+    os.makedirs(LIB_DIR, exist_ok=True)
     
     # Determine platform and build
-    if platform.system() == "Windows":
+    if _IS_WINDOWS:
         print("Building on Windows...")
         
         # First check if Visual Studio is available
-        if shutil.which("cl.exe"):
+        if _which("cl.exe"):
             print("Using Visual Studio for building")
-            return run_command("build.bat", cwd=project_root)
+            return run_command(["cmd", "/c", os.path.join(PROJECT_ROOT, "build.bat")], cwd=PROJECT_ROOT)
         else:
             # Try MinGW
             print("Visual Studio compiler not found, trying MinGW...")
-            return run_command("cmake -G \"MinGW Makefiles\" .. && cmake --build .", cwd=build_dir)
+            if not run_command(["cmake", "-G", "MinGW Makefiles", ".."], cwd=BUILD_DIR):
+                return False
+            return run_command(["cmake", "--build", "."], cwd=BUILD_DIR)
     else:
         # Unix-like systems (Linux, macOS)
-        print(f"Building on {platform.system()}...")
+        print(f"Building on {_SYSTEM}...")
         
-        # Make build script executable
+        build_script = os.path.join(PROJECT_ROOT, 'build.sh')
+        
+        # Make build script executable, unless it already is
         try:
-            build_script = os.path.join(project_root, 'build.sh')
-            os.chmod(build_script, 0o755)
-            print("Made build.sh executable")
+            if not os.stat(build_script).st_mode & 0o111:
+                os.chmod(build_script, 0o755)
+                print("Made build.sh executable")
         except Exception as e:
             print(f"Warning: Could not make build.sh executable: {e}")
         
         # Run the build script
-        return run_command('./build.sh', cwd=project_root)
+        return run_command([build_script], cwd=PROJECT_ROOT)
 
 def setup_python_environment():
     """Set up the Python environment."""
@@ -93,9 +107,9 @@ def setup_python_environment():
     print("Installing required Python packages...")
     packages = ["PyQt5", "pillow", "scipy"]
     
-    for package in packages:
-        print(f"Installing {package}...")
-        run_command(f"{sys.executable} -m pip install {package}")
+    # A single pip invocation resolves all packages in one pass
+    print(f"Installing {', '.join(packages)}...")
+    run_command([sys.executable, "-m", "pip", "install", "--disable-pip-version-check", *packages])
     
     return True
 
@@ -103,11 +117,8 @@ def setup_resources():
     """Set up game resources."""
     print_section("Setting Up Game Resources")
     
-    # Get project root
-    project_root = get_project_root()
-    
     # Run the resource setup script
-    resource_script = os.path.join(project_root, 'src', 'frontend', 'setup_resources.py')
+    resource_script = os.path.join(SRC_FRONTEND, 'setup_resources.py')
     
     if os.path.exists(resource_script):
         try:
@@ -118,7 +129,7 @@ def setup_resources():
             pass
         
         # Run the script
-        return run_command(f"{sys.executable} {resource_script}")
+        return run_command([sys.executable, resource_script])
     else:
         print(f"Error: Resource setup script not found at {resource_script}")
         return False
@@ -127,25 +138,24 @@ def create_launcher():
     """Create a platform-specific launcher."""
     print_section("Creating Game Launcher")
     
-    # Get project root
-    project_root = get_project_root()
-    
-    if platform.system() == "Windows":
+    if _IS_WINDOWS:
         # Create a Windows .bat launcher
-        launcher_path = os.path.join(project_root, 'play_gomoku.bat')
-        with open(launcher_path, 'w') as f:
-            f.write('@echo off\n')
-            f.write('echo Starting Five in a Row (Gomoku)...\n')
-            f.write(f'"{sys.executable}" "{os.path.join(project_root, "play_gomoku.py")}"\n')
+        launcher_path = os.path.join(PROJECT_ROOT, 'play_gomoku.bat')
+        Path(launcher_path).write_text(
+            '@echo off\n'
+            'echo Starting Five in a Row (Gomoku)...\n'
+            f'"{sys.executable}" "{os.path.join(PROJECT_ROOT, "play_gomoku.py")}"\n'
+        )
         
         print(f"Created Windows launcher: {launcher_path}")
     else:
         # Create a shell script launcher
-        launcher_path = os.path.join(project_root, 'play_gomoku.sh')
-        with open(launcher_path, 'w') as f:
-            f.write('#!/bin/bash\n\n')
-            f.write('echo "Starting Five in a Row (Gomoku)..."\n')
-            f.write(f'"{sys.executable}" "{os.path.join(project_root, "play_gomoku.py")}"\n')
+        launcher_path = os.path.join(PROJECT_ROOT, 'play_gomoku.sh')
+        Path(launcher_path).write_text(
+            '#!/bin/bash\n\n'
+            'echo "Starting Five in a Row (Gomoku)..."\n'
+            f'"{sys.executable}" "{os.path.join(PROJECT_ROOT, "play_gomoku.py")}"\n'
+        )
         
         # Make it executable
         try:
@@ -161,12 +171,9 @@ def create_desktop_shortcut():
     """Create a desktop shortcut for easier access."""
     print_section("Creating Desktop Shortcut")
     
-    # Get project root
-    project_root = get_project_root()
-    
     try:
         # Get user's desktop path
-        if platform.system() == "Windows":
+        if _IS_WINDOWS:
             desktop = os.path.join(os.path.expanduser("~"), "Desktop")
         else:
             desktop = os.path.join(os.path.expanduser("~"), "Desktop")
@@ -186,7 +193,7 @@ def create_desktop_shortcut():
                         desktop = path
                         break
         
-        if platform.system() == "Windows":
+        if _IS_WINDOWS:
             # Create a Windows shortcut
             shortcut_path = os.path.join(desktop, "Five in a Row.lnk")
             
@@ -194,29 +201,30 @@ def create_desktop_shortcut():
                 import win32com.client
                 shell = win32com.client.Dispatch("WScript.Shell")
                 shortcut = shell.CreateShortCut(shortcut_path)
-                shortcut.TargetPath = os.path.join(project_root, "play_gomoku.bat")
-                shortcut.WorkingDirectory = project_root
-                shortcut.IconLocation = os.path.join(project_root, "resources", "gomoku_icon.ico")
+                shortcut.TargetPath = os.path.join(PROJECT_ROOT, "play_gomoku.bat")
+                shortcut.WorkingDirectory = PROJECT_ROOT
+                shortcut.IconLocation = os.path.join(PROJECT_ROOT, "resources", "gomoku_icon.ico")
                 shortcut.save()
                 print(f"Created desktop shortcut: {shortcut_path}")
             except ImportError:
                 print("Warning: win32com.client module not available, skipping Windows shortcut creation")
                 return False
                 
-        elif platform.system() == "Darwin":  # macOS
+        elif _IS_DARWIN:  # macOS
             # Create a macOS .command file
             shortcut_path = os.path.join(desktop, "Five in a Row.command")
             
-            with open(shortcut_path, 'w') as f:
-                f.write('#!/bin/bash\n\n')
-                f.write(f'cd "{project_root}"\n')
-                f.write('./play_gomoku.sh\n')
+            Path(shortcut_path).write_text(
+                '#!/bin/bash\n\n'
+                f'cd "{PROJECT_ROOT}"\n'
+                './play_gomoku.sh\n'
+            )
             
             # Make it executable
             os.chmod(shortcut_path, 0o755)
             
             # Try to set a custom icon for the macOS shortcut
-            icon_path = os.path.join(project_root, 'resources', 'gomoku_icon.png')
+            icon_path = os.path.join(PROJECT_ROOT, 'resources', 'gomoku_icon.png')
             if os.path.exists(icon_path):
                 try:
                     # Use AppleScript to set the icon (this requires user with admin privileges)
@@ -234,19 +242,20 @@ def create_desktop_shortcut():
                     
             print(f"Created macOS desktop shortcut: {shortcut_path}")
             
-        elif platform.system() == "Linux":
+        elif _SYSTEM == "Linux":
             # Create a Linux .desktop file
             shortcut_path = os.path.join(desktop, "five-in-a-row.desktop")
             
-            with open(shortcut_path, 'w') as f:
-                f.write("[Desktop Entry]\n")
-                f.write("Type=Application\n")
-                f.write("Name=Five in a Row\n")
-                f.write("Comment=Play the classic Gomoku game\n")
-                f.write(f"Exec={os.path.join(project_root, 'play_gomoku.sh')}\n")
-                f.write(f"Icon={os.path.join(project_root, 'resources', 'gomoku_icon.png')}\n")
-                f.write("Terminal=false\n")
-                f.write("Categories=Game;BoardGame;\n")
+            Path(shortcut_path).write_text(
+                "[Desktop Entry]\n"
+                "Type=Application\n"
+                "Name=Five in a Row\n"
+                "Comment=Play the classic Gomoku game\n"
+                f"Exec={os.path.join(PROJECT_ROOT, 'play_gomoku.sh')}\n"
+                f"Icon={os.path.join(PROJECT_ROOT, 'resources', 'gomoku_icon.png')}\n"
+                "Terminal=false\n"
+                "Categories=Game;BoardGame;\n"
+            )
             
             # Make it executable
             os.chmod(shortcut_path, 0o755)
@@ -258,6 +267,8 @@ def create_desktop_shortcut():
         return False
 
 def main():
+    import argparse
+    
     parser = argparse.ArgumentParser(description='Five in a Row (Gomoku) Installer')
     parser.add_argument('--no-build', action='store_true', help='Skip building the C++ backend')
     parser.add_argument('--no-deps', action='store_true', help='Skip Python package installation')
@@ -266,7 +277,7 @@ def main():
     args = parser.parse_args()
     
     print_section("Five in a Row (Gomoku) Installer")
-    print(f"Platform: {platform.system()} {platform.release()}")
+    print(f"Platform: {_SYSTEM} {platform.release()}")
     print(f"Python: {platform.python_version()}")
     
     success = True
@@ -293,7 +304,7 @@ def main():
         print_section("Installation Completed Successfully")
         print("You can now start the game by running:")
         
-        if platform.system() == "Windows":
+        if _IS_WINDOWS:
             print("  play_gomoku.bat")
         else:
             print("  ./play_gomoku.sh")
@@ -9,6 +9,55 @@ import sys
 import platform
 import subprocess
 
+# The platform can't change while the launcher runs, so look it up once
+_SYSTEM = platform.system()
+
+# Name of the C++ backend library on this platform (None if unsupported)
+if _SYSTEM == 'Darwin':  # macOS
+    _LIB_NAME = 'libgomoku.dylib'
+elif _SYSTEM == 'Linux':
+    _LIB_NAME = 'libgomoku.so'
+elif _SYSTEM == 'Windows':
+    _LIB_NAME = 'gomoku.dll'
+else:
+    _LIB_NAME = None
+
+# Resources that setup_resources.py generates when missing
+_REQUIRED_RESOURCES = ['gomoku_icon.png']
+
+def resources_ready(resources_dir):
+    """Check whether every resource produced by setup_resources.py is present."""
+    return all(os.path.isfile(os.path.join(resources_dir, name)) for name in _REQUIRED_RESOURCES)
+
+def sync_library(source, dest):
+    """Make dest match the library at source; return False if it already did."""
+    source_stat = os.stat(source)
+    try:
+        dest_stat = os.stat(dest)
+        if (dest_stat.st_size, dest_stat.st_mtime_ns) == (source_stat.st_size, source_stat.st_mtime_ns):
+            return False
+    except FileNotFoundError:
+        pass
+    
+    # Stage next to the destination, then swap it in atomically
+    temp_path = dest + '.tmp'
+    try:
+        os.unlink(temp_path)
+    except FileNotFoundError:
+        pass
+    
+    try:
+        # A hard link shares the data instead of copying it
+        os.link(source, temp_path)
+    except OSError:
+        # Hard links fail across devices (EXDEV) and on some filesystems;
+        # copy2 keeps the mtime so the next launch can still skip the copy
+        import shutil
+        shutil.copy2(source, temp_path)
+    
+    os.replace(temp_path, dest)
+    return True
+
 def run_game():
     """Set up environment and launch the game."""
     # Get the script directory which should be the project root
@@ -19,7 +68,7 @@ def run_game():
         print("Warning: Could not locate src directory. File paths might be incorrect.")
     
     # Print system information
-    print(f"OS: {platform.system()} {platform.release()}")
+    print(f"OS: {_SYSTEM} {platform.release()}")
     print(f"Python: {sys.version}")
     print(f"Project root: {project_root}")
     
@@ -30,32 +79,27 @@ def run_game():
         print(f"Created lib directory: {lib_dir}")
     
     # Copy the compiled library to lib directory
-    library_filename = None
-    if platform.system() == 'Darwin':  # macOS
-        library_filename = 'libgomoku.dylib'
-    elif platform.system() == 'Linux':
-        library_filename = 'libgomoku.so'
-    elif platform.system() == 'Windows':
-        library_filename = 'gomoku.dll'
+    if _LIB_NAME is None:
+        print(f"Warning: Unsupported platform {_SYSTEM}")
     else:
-        print(f"Warning: Unsupported platform {platform.system()}")
-    
-    if library_filename:
-        build_lib_path = os.path.join(project_root, 'build', library_filename)
-        lib_path = os.path.join(lib_dir, library_filename)
+        build_lib_path = os.path.join(project_root, 'build', _LIB_NAME)
+        lib_path = os.path.join(lib_dir, _LIB_NAME)
         
         # Check if library exists in build directory
         if os.path.exists(build_lib_path):
-            # Copy to lib directory
-            import shutil
-            shutil.copyfile(build_lib_path, lib_path)
-            print(f"Copied library from {build_lib_path} to {lib_path}")
+            # Update the lib directory only when the build output changed
+            if sync_library(build_lib_path, lib_path):
+                print(f"Copied library from {build_lib_path} to {lib_path}")
+            else:
+                print(f"Library at {lib_path} is up to date")
         else:
             print(f"Warning: Library not found at {build_lib_path}")
     
-    # Run resource setup script
+    # Run resource setup script, unless its work has already been done
     resource_setup_script = os.path.join(project_root, 'src', 'frontend', 'setup_resources.py')
-    if os.path.exists(resource_setup_script):
+    if resources_ready(os.path.join(project_root, 'resources')):
+        print("\n=== Resources already set up ===")
+    elif os.path.exists(resource_setup_script):
         print("\n=== Setting up resources ===")
         subprocess.call([sys.executable, resource_setup_script])
     
@@ -9,11 +9,24 @@ import sys
 import platform
 import subprocess
 import shutil
+import struct
+import tempfile
 import argparse
+import hashlib
 import time
 import urllib.request
+import uuid
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
+from diagnostics import ThreadLocalOutput, list_directory
+
+# Values that can't change while the installer runs, computed once
+PROJECT_ROOT = os.path.dirname(os.path.abspath(__file__))
+SYSTEM = platform.system()
+PYTHON_VERSION = ".".join(map(str, sys.version_info[:3]))
+LIB_NAME = {"Windows": "gomoku.dll", "Darwin": "libgomoku.dylib"}.get(SYSTEM, "libgomoku.so")
+
 # ANSI color codes for prettier output
 class Colors:
     HEADER = '\033[95m'
@@ -47,19 +60,48 @@ def print_step(text):
     """Print a step message."""
     print(f"{Colors.BLUE}→ {text}{Colors.ENDC}")
 
-def run_command(command, cwd=None, show_output=True):
-    """Run a shell command and return the result."""
-    print_step(f"Running: {command}")
+def run_alongside(step, background_steps):
+    """Run step on this thread while background_steps run in parallel; return all results in order.
+    
+    The step's output is shown as it happens. The background steps are short,
+    so their output is buffered per thread and written out afterwards.
+    """
+    output = ThreadLocalOutput(sys.stdout)
+    
+    def run_buffered(background_step):
+        buffer = output.capture()
+        try:
+            return background_step(), buffer.getvalue()
+        finally:
+            output.release()
+    
+    sys.stdout = output
+    try:
+        with ThreadPoolExecutor(max_workers=len(background_steps)) as executor:
+            futures = [executor.submit(run_buffered, background_step) for background_step in background_steps]
+            result = step()
+            outcomes = [future.result() for future in futures]
+    finally:
+        sys.stdout = output.stream
+    
+    results = [result]
+    for background_result, text in outcomes:
+        sys.stdout.write(text)
+        results.append(background_result)
+    return results
+
+def run_command(command, cwd=None, show_output=True, shell=False):
+    """Run a command given as an argument list (or a string with shell=True)."""
+    print_step(f"Running: {command if shell else ' '.join(command)}")
     
     try:
-        # Use shell=True for complex commands (pipes, redirections)
         result = subprocess.run(
             command,
-            shell=True,
+            shell=shell,
             cwd=cwd,
             stdout=subprocess.PIPE if show_output else subprocess.DEVNULL,
             stderr=subprocess.PIPE if show_output else subprocess.DEVNULL,
-            universal_newlines=True,
+            text=True,
             check=False  # Don't raise exception on non-zero return code
         )
         
@@ -77,9 +119,29 @@ def run_command(command, cwd=None, show_output=True):
         print_error(f"Failed to execute command: {e}")
         return False
 
-def get_project_root():
-    """Get the absolute path to the project root directory."""
-    return os.path.dirname(os.path.abspath(__file__))
+def probe_tool(argv, timeout=5):
+    """Run a tool's probe command and return the result, or None if it couldn't run."""
+    try:
+        return subprocess.run(
+            argv,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            text=True,
+            timeout=timeout  # A broken toolchain on PATH shouldn't stall the installer
+        )
+    except (OSError, subprocess.TimeoutExpired):
+        return None
+
+def probe_compiler(name, work_dir):
+    """Compile and link a trivial program with the named compiler; return True if it worked."""
+    source = os.path.join(work_dir, "probe.cpp")
+    output = os.path.join(work_dir, f"probe-{name}.exe")
+    if name == "cl":
+        argv = ["cl", "/nologo", f"/Fo{output}.obj", source, f"/Fe{output}"]
+    else:
+        argv = [name, source, "-o", output]
+    result = probe_tool(argv, timeout=30)
+    return result is not None and result.returncode == 0
 
 def check_prerequisites():
     """Check if all required tools are installed."""
@@ -88,79 +150,48 @@ def check_prerequisites():
     all_ok = True
     
     # Check Python version
-    python_version = platform.python_version()
-    print(f"Python version: {python_version}")
+    print(f"Python version: {PYTHON_VERSION}")
     
-    major, minor, _ = [int(n) for n in python_version.split('.')]
-    if major < 3 or (major == 3 and minor < 6):
+    if sys.version_info < (3, 6):
         print_warning("Python 3.6 or higher is recommended")
         all_ok = False
     else:
         print_success("Python version is supported")
     
-    # Check for CMake
-    try:
-        result = subprocess.run(
-            ["cmake", "--version"],
-            stdout=subprocess.PIPE, 
-            stderr=subprocess.PIPE,
-            universal_newlines=True
-        )
-        if result.returncode == 0:
-            cmake_version = result.stdout.split('\n')[0]
-            print_success(f"CMake found: {cmake_version}")
-        else:
-            print_warning("CMake not found. Please install CMake.")
-            all_ok = False
-    except:
+    # Probe CMake and test-compile with each candidate compiler in parallel;
+    # a successful compile and link proves more than a --version banner
+    if SYSTEM == "Windows":
+        compilers = ["cl", "g++", "clang++"]  # Visual C++, MinGW, LLVM
+    else:
+        compilers = ["c++", "g++", "clang++"]  # GCC/Clang
+    
+    with tempfile.TemporaryDirectory() as work_dir:
+        Path(work_dir, "probe.cpp").write_text("int main() { return 0; }\n")
+        with ThreadPoolExecutor(max_workers=len(compilers) + 1) as executor:
+            cmake_future = executor.submit(probe_tool, ["cmake", "--version"])
+            compiler_ok = list(executor.map(probe_compiler, compilers, [work_dir] * len(compilers)))
+            cmake = cmake_future.result()
+    
+    # Report in a fixed order regardless of which probe finished first
+    if cmake is not None and cmake.returncode == 0:
+        cmake_version = cmake.stdout.split('\n')[0]
+        print_success(f"CMake found: {cmake_version}")
+    else:
         print_warning("CMake not found. Please install CMake.")
         all_ok = False
     
-    # Check for C++ compiler
-    if platform.system() == "Windows":
-        try:
-            # Check for Visual C++
-            result = subprocess.run(
-                ["cl", "/?"],
-                stdout=subprocess.PIPE, 
-                stderr=subprocess.PIPE,
-                universal_newlines=True
-            )
-            if result.returncode == 0:
-                print_success("Visual C++ compiler found")
-            else:
-                # Check for MinGW G++
-                result = subprocess.run(
-                    ["g++", "--version"],
-                    stdout=subprocess.PIPE, 
-                    stderr=subprocess.PIPE,
-                    universal_newlines=True
-                )
-                if result.returncode == 0:
-                    print_success(f"G++ compiler found: {result.stdout.split('\\n')[0]}")
-                else:
-                    print_warning("No C++ compiler found. Please install Visual Studio or MinGW.")
-                    all_ok = False
-        except:
-            print_warning("No C++ compiler found. Please install Visual Studio or MinGW.")
-            all_ok = False
+    # The first working compiler in preference order is the one CMake should use
+    compiler = next((name for name, ok in zip(compilers, compiler_ok) if ok), None)
+    if compiler is not None:
+        compiler_path = shutil.which(compiler) or compiler
+        os.environ.setdefault("CXX", compiler_path)
+        print_success(f"C++ compiler works: {compiler_path}")
+    elif SYSTEM == "Windows":
+        print_warning("No C++ compiler found. Please install Visual Studio or MinGW.")
+        all_ok = False
     else:
-        # Check for GCC/Clang on Unix systems
-        try:
-            result = subprocess.run(
-                ["c++", "--version"],
-                stdout=subprocess.PIPE, 
-                stderr=subprocess.PIPE,
-                universal_newlines=True
-            )
-            if result.returncode == 0:
-                print_success(f"C++ compiler found: {result.stdout.split('\\n')[0]}")
-            else:
-                print_warning("No C++ compiler found. Please install GCC or Clang.")
-                all_ok = False
-        except:
-            print_warning("No C++ compiler found. Please install GCC or Clang.")
-            all_ok = False
+        print_warning("No C++ compiler found. Please install GCC or Clang.")
+        all_ok = False
     
     return all_ok
 
@@ -169,11 +200,21 @@ def install_python_packages():
     print_header("Installing Python Packages")
     
     packages = ["PyQt5", "pillow", "scipy"]
+    pip_install = [sys.executable, "-m", "pip", "install", "--disable-pip-version-check", "--no-input"]
+    
+    # Install everything with one pip run so pip starts and resolves only once
+    print_step(f"Installing {', '.join(packages)}...")
+    if run_command([*pip_install, *packages], show_output=True):
+        print_success("All packages installed/updated successfully")
+        return True
+    
+    # The batch failed; retry one by one so a single bad package doesn't block the rest
+    print_warning("Batch install failed, retrying packages individually...")
     all_ok = True
     
     for package in packages:
         print_step(f"Installing {package}...")
-        if run_command(f"{sys.executable} -m pip install {package}", show_output=True):
+        if run_command([*pip_install, package], show_output=True):
             print_success(f"{package} installed/updated successfully")
         else:
             print_warning(f"Failed to install {package}")
@@ -181,26 +222,104 @@ def install_python_packages():
     
     return all_ok
 
-def build_backend():
-    """Build the C++ backend library."""
+def cmake_generator_args(build_dir):
+    """Return the CMake generator arguments, preferring Ninja when it is installed."""
+    if not shutil.which("ninja"):
+        return []
+    # CMake refuses to switch generators in an already-configured build directory
+    try:
+        with open(os.path.join(build_dir, "CMakeCache.txt")) as f:
+            if "CMAKE_GENERATOR:INTERNAL=Ninja\n" not in f.read():
+                return []
+    except FileNotFoundError:
+        pass
+    return ["-G", "Ninja", "-DCMAKE_BUILD_TYPE=Release"]
+
+def compiler_launcher_args():
+    """Return CMake arguments that route compiles through ccache/sccache if installed."""
+    for launcher in (("sccache", "ccache") if SYSTEM == "Windows" else ("ccache", "sccache")):
+        if shutil.which(launcher):
+            # Keep the cache inside the project so repeated installs reuse it
+            os.environ.setdefault(f"{launcher.upper()}_DIR", os.path.join(PROJECT_ROOT, f".{launcher}"))
+            # CMake 3.17+ also reads these, so build.bat/build.sh pick up the launcher
+            os.environ.setdefault("CMAKE_C_COMPILER_LAUNCHER", launcher)
+            os.environ.setdefault("CMAKE_CXX_COMPILER_LAUNCHER", launcher)
+            return [f"-DCMAKE_C_COMPILER_LAUNCHER={launcher}",
+                    f"-DCMAKE_CXX_COMPILER_LAUNCHER={launcher}"]
+    return []
+
+def install_library(source, dest):
+    """Place the built library at dest, hard-linking it when possible."""
+    # Stage next to the destination, then swap it in atomically
+    temp_path = dest + ".tmp"
+    try:
+        os.unlink(temp_path)
+    except FileNotFoundError:
+        pass
+    
+    try:
+        # A hard link shares the data instead of copying it
+        os.link(source, temp_path)
+    except OSError:
+        # Hard links fail across devices and on some filesystems; copyfile
+        # uses the kernel's fast copy paths where available
+        shutil.copyfile(source, temp_path)
+        os.chmod(temp_path, 0o755)
+    
+    os.replace(temp_path, dest)
+
+def build_stamp():
+    """Return a fingerprint of the CMake configuration the library is built from."""
+    with open(os.path.join(PROJECT_ROOT, "CMakeLists.txt"), "rb") as f:
+        return hashlib.sha256(f.read()).hexdigest()
+
+def backend_is_fresh(stamp):
+    """Check whether lib/ holds a library built from the current sources and configuration."""
+    lib_dir = os.path.join(PROJECT_ROOT, "lib")
+    try:
+        lib_mtime = os.stat(os.path.join(lib_dir, LIB_NAME)).st_mtime
+        with open(os.path.join(lib_dir, ".build_stamp")) as f:
+            if f.read().strip() != stamp:
+                return False
+    except OSError:
+        return False
+    
+    sources = Path(PROJECT_ROOT, "src", "backend").rglob("*")
+    newest_source = max((p.stat().st_mtime for p in sources if p.suffix in (".cpp", ".h", ".hpp")), default=0)
+    return lib_mtime > newest_source
+
+def build_backend(force_rebuild=False):
+    """Build the C++ backend library unless the one in lib/ is already up to date."""
     print_header("Building C++ Backend")
     
-    project_root = get_project_root()
+    stamp = build_stamp()
+    if not force_rebuild and backend_is_fresh(stamp):
+        print_success("Backend is up to date, skipping build")
+        return True
+    
+    if not compile_backend():
+        return False
     
+    Path(PROJECT_ROOT, "lib", ".build_stamp").write_text(stamp + "\n")
+    return True
+
+def compile_backend():
+    """Build the C++ backend library."""
     # Create build and lib directories if they don't exist
-    build_dir = os.path.join(project_root, "build")
-    lib_dir = os.path.join(project_root, "lib")
+    build_dir = os.path.join(PROJECT_ROOT, "build")
+    lib_dir = os.path.join(PROJECT_ROOT, "lib")
     
     os.makedirs(build_dir, exist_ok=True)
     os.makedirs(lib_dir, exist_ok=True)
+    launcher_args = compiler_launcher_args()
     
     # Build based on platform
-    if platform.system() == "Windows":
+    if SYSTEM == "Windows":
         # Try running the batch file first
-        batch_file = os.path.join(project_root, "build.bat")
+        batch_file = os.path.join(PROJECT_ROOT, "build.bat")
         if os.path.exists(batch_file):
             print_step("Running build.bat...")
-            if run_command(batch_file, cwd=project_root):
+            if run_command(["cmd", "/c", batch_file], cwd=PROJECT_ROOT):
                 print_success("Build completed successfully")
                 return True
             else:
@@ -210,19 +329,20 @@ def build_backend():
         print_step("Building with CMake...")
         
         # Configure
-        if run_command("cmake ..", cwd=build_dir):
+        if run_command(["cmake", *cmake_generator_args(build_dir), *launcher_args, ".."], cwd=build_dir):
             # Build
-            if run_command("cmake --build . --config Release", cwd=build_dir):
+            if run_command(["cmake", "--build", ".", "--config", "Release",
+                            "--parallel", str(os.cpu_count() or 1)], cwd=build_dir):
                 # Copy DLL to lib directory
                 if os.path.exists(os.path.join(build_dir, "Release", "gomoku.dll")):
-                    shutil.copy(
+                    install_library(
                         os.path.join(build_dir, "Release", "gomoku.dll"),
                         os.path.join(lib_dir, "gomoku.dll")
                     )
                     print_success("Copied gomoku.dll to lib directory")
                     return True
                 elif os.path.exists(os.path.join(build_dir, "gomoku.dll")):
-                    shutil.copy(
+                    install_library(
                         os.path.join(build_dir, "gomoku.dll"),
                         os.path.join(lib_dir, "gomoku.dll")
                     )
@@ -239,7 +359,7 @@ def build_backend():
             return False
     else:
         # Unix-like platforms (macOS, Linux)
-        build_script = os.path.join(project_root, "build.sh")
+        build_script = os.path.join(PROJECT_ROOT, "build.sh")
         
         # Make build script executable
         try:
@@ -248,24 +368,20 @@ def build_backend():
             print_warning(f"Could not make build script executable: {e}")
         
         # Run build script
-        if run_command(build_script, cwd=project_root):
+        if run_command([build_script], cwd=PROJECT_ROOT):
             print_success("Build completed successfully")
             return True
         else:
             print_warning("build.sh failed, trying CMake directly...")
             
             # If shell script fails, use CMake directly
-            if run_command("cmake ..", cwd=build_dir):
-                if run_command("make", cwd=build_dir):
+            if run_command(["cmake", *cmake_generator_args(build_dir), *launcher_args, ".."], cwd=build_dir):
+                if run_command(["cmake", "--build", ".", "--parallel", str(os.cpu_count() or 1)], cwd=build_dir):
                     # Copy shared library to lib directory
-                    lib_name = None
-                    if platform.system() == "Darwin":  # macOS
-                        lib_name = "libgomoku.dylib"
-                    else:  # Linux
-                        lib_name = "libgomoku.so"
-                        
+                    lib_name = LIB_NAME
+                    
                     if os.path.exists(os.path.join(build_dir, lib_name)):
-                        shutil.copy(
+                        install_library(
                             os.path.join(build_dir, lib_name),
                             os.path.join(lib_dir, lib_name)
                         )
@@ -285,24 +401,22 @@ def setup_resources():
     """Set up game resources."""
     print_header("Setting Up Game Resources")
     
-    project_root = get_project_root()
-    
     # Create resources directory if it doesn't exist
-    resources_dir = os.path.join(project_root, "resources")
+    resources_dir = os.path.join(PROJECT_ROOT, "resources")
     os.makedirs(resources_dir, exist_ok=True)
     
     # Try running the setup_resources.py script
-    resource_script = os.path.join(project_root, "src", "frontend", "setup_resources.py")
+    resource_script = os.path.join(PROJECT_ROOT, "src", "frontend", "setup_resources.py")
     
     if os.path.exists(resource_script):
         try:
             # Make script executable on Unix-like platforms
-            if platform.system() != "Windows":
+            if SYSTEM != "Windows":
                 os.chmod(resource_script, 0o755)
         except Exception:
             pass
         
-        if run_command(f"{sys.executable} {resource_script}"):
+        if run_command([sys.executable, resource_script]):
             print_success("Resource setup completed successfully")
             return True
         else:
@@ -318,10 +432,8 @@ def setup_resources():
         "gomoku_icon.png"
     ]
     
-    missing = []
-    for resource in required_resources:
-        if not os.path.exists(os.path.join(resources_dir, resource)):
-            missing.append(resource)
+    present = list_directory(resources_dir)
+    missing = [resource for resource in required_resources if resource not in present]
     
     if not missing:
         print_success("All required resources already exist")
@@ -333,19 +445,17 @@ def setup_resources():
     # Sound files are no longer needed
     
     if "gomoku_icon.png" in missing:
-        icon_script = os.path.join(project_root, "src", "frontend", "create_icon.py")
+        icon_script = os.path.join(PROJECT_ROOT, "src", "frontend", "create_icon.py")
         if os.path.exists(icon_script):
-            if run_command(f"{sys.executable} {icon_script}"):
+            if run_command([sys.executable, icon_script]):
                 print_success("Game icon generated successfully")
             else:
                 print_warning("Failed to generate game icon")
                 return False
     
     # Check if resources are now available
-    still_missing = []
-    for resource in required_resources:
-        if not os.path.exists(os.path.join(resources_dir, resource)):
-            still_missing.append(resource)
+    present = list_directory(resources_dir)
+    still_missing = [resource for resource in required_resources if resource not in present]
     
     if still_missing:
         print_warning(f"Some resources could not be generated: {', '.join(still_missing)}")
@@ -358,10 +468,8 @@ def create_launchers():
     """Create platform-specific launchers."""
     print_header("Creating Game Launchers")
     
-    project_root = get_project_root()
-    
     # Create the main Python launcher script (play_gomoku.py)
-    launcher_py_path = os.path.join(project_root, "play_gomoku.py")
+    launcher_py_path = os.path.join(PROJECT_ROOT, "play_gomoku.py")
     
     # Check if the launcher script already exists
     if not os.path.exists(launcher_py_path):
@@ -449,11 +557,10 @@ if __name__ == "__main__":
     sys.exit(run_game())
 """
         
-        with open(launcher_py_path, "w") as f:
-            f.write(launcher_code)
+        Path(launcher_py_path).write_text(launcher_code)
         
         # Make it executable on Unix-like platforms
-        if platform.system() != "Windows":
+        if SYSTEM != "Windows":
             os.chmod(launcher_py_path, 0o755)
         
         print_success("Created Python launcher script")
@@ -461,75 +568,77 @@ if __name__ == "__main__":
         print_success("Python launcher script already exists")
     
     # Create platform-specific launchers
-    if platform.system() == "Windows":
+    if SYSTEM == "Windows":
         # Create Windows batch file
-        bat_path = os.path.join(project_root, "play_gomoku.bat")
+        bat_path = os.path.join(PROJECT_ROOT, "play_gomoku.bat")
         
         if not os.path.exists(bat_path):
             print_step("Creating Windows batch file...")
             
-            with open(bat_path, "w") as f:
-                f.write("@echo off\n")
-                f.write("echo Starting Five in a Row (Gomoku)...\n")
-                f.write("echo.\n\n")
-                f.write("REM Make sure we're in the right directory\n")
-                f.write("cd /d \"%~dp0\"\n\n")
-                f.write("REM Set up Python path environment variable\n")
-                f.write("set PYTHONPATH=%CD%\n\n")
-                f.write("REM Check if Python is available\n")
-                f.write("python --version >nul 2>&1\n")
-                f.write("if %ERRORLEVEL% neq 0 (\n")
-                f.write("    echo Python not found in PATH. Please make sure Python is installed.\n")
-                f.write("    echo Press any key to exit...\n")
-                f.write("    pause > nul\n")
-                f.write("    exit /b 1\n")
-                f.write(")\n\n")
-                f.write("REM Run the launcher script\n")
-                f.write("python play_gomoku.py\n\n")
-                f.write("REM If the game exited with an error, wait for user input\n")
-                f.write("if %ERRORLEVEL% neq 0 (\n")
-                f.write("    echo.\n")
-                f.write("    echo The game exited with an error. Check the output above for details.\n")
-                f.write("    echo Press any key to exit...\n")
-                f.write("    pause > nul\n")
-                f.write(")\n")
+            Path(bat_path).write_text(
+                "@echo off\n"
+                "echo Starting Five in a Row (Gomoku)...\n"
+                "echo.\n\n"
+                "REM Make sure we're in the right directory\n"
+                "cd /d \"%~dp0\"\n\n"
+                "REM Set up Python path environment variable\n"
+                "set PYTHONPATH=%CD%\n\n"
+                "REM Check if Python is available\n"
+                "python --version >nul 2>&1\n"
+                "if %ERRORLEVEL% neq 0 (\n"
+                "    echo Python not found in PATH. Please make sure Python is installed.\n"
+                "    echo Press any key to exit...\n"
+                "    pause > nul\n"
+                "    exit /b 1\n"
+                ")\n\n"
+                "REM Run the launcher script\n"
+                "python play_gomoku.py\n\n"
+                "REM If the game exited with an error, wait for user input\n"
+                "if %ERRORLEVEL% neq 0 (\n"
+                "    echo.\n"
+                "    echo The game exited with an error. Check the output above for details.\n"
+                "    echo Press any key to exit...\n"
+                "    pause > nul\n"
+                ")\n"
+            )
             
             print_success("Created Windows batch file")
         else:
             print_success("Windows batch file already exists")
     else:
         # Create shell script for Unix-like platforms
-        sh_path = os.path.join(project_root, "play_gomoku.sh")
+        sh_path = os.path.join(PROJECT_ROOT, "play_gomoku.sh")
         
         if not os.path.exists(sh_path):
             print_step("Creating shell script...")
             
-            with open(sh_path, "w") as f:
-                f.write("#!/bin/bash\n\n")
-                f.write("echo \"Starting Five in a Row (Gomoku)...\"\n")
-                f.write("echo \"\"\n\n")
-                f.write("# Get the directory where the script is located\n")
-                f.write("SCRIPT_DIR=\"$( cd \"$( dirname \"${BASH_SOURCE[0]}\" )\" && pwd )\"\n\n")
-                f.write("# Change to the script directory\n")
-                f.write("cd \"$SCRIPT_DIR\"\n\n")
-                f.write("# Set up Python path environment variable\n")
-                f.write("export PYTHONPATH=\"$SCRIPT_DIR\"\n\n")
-                f.write("# Check if Python is available\n")
-                f.write("if ! command -v python3 &> /dev/null; then\n")
-                f.write("    echo \"Python 3 not found. Please make sure Python 3 is installed.\"\n")
-                f.write("    echo \"Press Enter to exit...\"\n")
-                f.write("    read\n")
-                f.write("    exit 1\n")
-                f.write("fi\n\n")
-                f.write("# Run the launcher script\n")
-                f.write("python3 play_gomoku.py\n\n")
-                f.write("# If the game exited with an error, wait for user input\n")
-                f.write("if [ $? -ne 0 ]; then\n")
-                f.write("    echo \"\"\n")
-                f.write("    echo \"The game exited with an error. Check the output above for details.\"\n")
-                f.write("    echo \"Press Enter to exit...\"\n")
-                f.write("    read\n")
-                f.write("fi\n")
+            Path(sh_path).write_text(
+                "#!/bin/bash\n\n"
+                "echo \"Starting Five in a Row (Gomoku)...\"\n"
+                "echo \"\"\n\n"
+                "# Get the directory where the script is located\n"
+                "SCRIPT_DIR=\"$( cd \"$( dirname \"${BASH_SOURCE[0]}\" )\" && pwd )\"\n\n"
+                "# Change to the script directory\n"
+                "cd \"$SCRIPT_DIR\"\n\n"
+                "# Set up Python path environment variable\n"
+                "export PYTHONPATH=\"$SCRIPT_DIR\"\n\n"
+                "# Check if Python is available\n"
+                "if ! command -v python3 &> /dev/null; then\n"
+                "    echo \"Python 3 not found. Please make sure Python 3 is installed.\"\n"
+                "    echo \"Press Enter to exit...\"\n"
+                "    read\n"
+                "    exit 1\n"
+                "fi\n\n"
+                "# Run the launcher script\n"
+                "python3 play_gomoku.py\n\n"
+                "# If the game exited with an error, wait for user input\n"
+                "if [ $? -ne 0 ]; then\n"
+                "    echo \"\"\n"
+                "    echo \"The game exited with an error. Check the output above for details.\"\n"
+                "    echo \"Press Enter to exit...\"\n"
+                "    read\n"
+                "fi\n"
+            )
             
             # Make it executable
             os.chmod(sh_path, 0o755)
@@ -546,6 +655,38 @@ if __name__ == "__main__":
     
     return True
 
+def shell_link_bytes(target_path, working_dir):
+    """Build a minimal Windows shortcut (.lnk, MS-SHLLINK) pointing at a local file."""
+    def counted_string(text):
+        data = text.encode("utf-16-le")
+        return struct.pack("<H", len(data) // 2) + data
+    
+    # VolumeID for a fixed drive with an empty label, then the ANSI and
+    # Unicode forms of the target path with empty common path suffixes
+    volume_id = struct.pack("<4I", 17, 3, 0, 16) + b"\0"
+    base_path = target_path.encode("mbcs", "replace") + b"\0"
+    base_path_unicode = target_path.encode("utf-16-le") + b"\0\0"
+    header_size = 0x24
+    volume_offset = header_size
+    base_offset = volume_offset + len(volume_id)
+    suffix_offset = base_offset + len(base_path)
+    base_unicode_offset = suffix_offset + 1
+    suffix_unicode_offset = base_unicode_offset + len(base_path_unicode)
+    link_info_size = suffix_unicode_offset + 2
+    link_info = (
+        struct.pack("<9I", link_info_size, header_size, 0x1, volume_offset, base_offset, 0,
+                    suffix_offset, base_unicode_offset, suffix_unicode_offset)
+        + volume_id + base_path + b"\0" + base_path_unicode + b"\0\0"
+    )
+    
+    # HasLinkInfo | HasWorkingDir | IsUnicode; normal window, no hotkey
+    header = struct.pack(
+        "<I16sII24sIiIHHII",
+        0x4C, uuid.UUID("00021401-0000-0000-C000-000000000046").bytes_le,
+        0x02 | 0x10 | 0x80, 0x20, bytes(24), 0, 0, 1, 0, 0, 0, 0
+    )
+    return header + link_info + counted_string(working_dir) + struct.pack("<I", 0)
+
 def create_desktop_shortcut():
     """Create a desktop shortcut for the game."""
     print_header("Creating Desktop Shortcut")
@@ -573,9 +714,7 @@ def create_desktop_shortcut():
             print_warning("Could not locate desktop directory")
             return False
     
-    project_root = get_project_root()
-    
-    if platform.system() == "Windows":
+    if SYSTEM == "Windows":
         # Try to create a Windows shortcut (.lnk file)
         try:
             shortcut_path = os.path.join(desktop, "Five in a Row.lnk")
@@ -586,11 +725,11 @@ def create_desktop_shortcut():
                 
                 shell = win32com.client.Dispatch("WScript.Shell")
                 shortcut = shell.CreateShortCut(shortcut_path)
-                shortcut.TargetPath = os.path.join(project_root, "play_gomoku.bat")
-                shortcut.WorkingDirectory = project_root
+                shortcut.TargetPath = os.path.join(PROJECT_ROOT, "play_gomoku.bat")
+                shortcut.WorkingDirectory = PROJECT_ROOT
                 
                 # Add icon if available
-                icon_path = os.path.join(project_root, "resources", "gomoku_icon.png")
+                icon_path = os.path.join(PROJECT_ROOT, "resources", "gomoku_icon.png")
                 if os.path.exists(icon_path):
                     shortcut.IconLocation = icon_path
                 
@@ -599,55 +738,32 @@ def create_desktop_shortcut():
                 print_success(f"Created desktop shortcut at: {shortcut_path}")
                 return True
             except ImportError:
-                # If pywin32 is not available, try with PowerShell
-                print_step("pywin32 module not available, trying PowerShell...")
-                
-                ps_command = f"""
-                $WshShell = New-Object -ComObject WScript.Shell
-                $Shortcut = $WshShell.CreateShortcut("{shortcut_path}")
-                $Shortcut.TargetPath = "{os.path.join(project_root, 'play_gomoku.bat').replace('\\', '\\\\')}"
-                $Shortcut.WorkingDirectory = "{project_root.replace('\\', '\\\\')}"
-                $Shortcut.Save()
-                """
+                # Without pywin32, write the shortcut file directly instead of
+                # going through a PowerShell script
+                Path(shortcut_path).write_bytes(shell_link_bytes(
+                    os.path.join(PROJECT_ROOT, "play_gomoku.bat"), PROJECT_ROOT
+                ))
                 
-                with open(os.path.join(project_root, "create_shortcut.ps1"), "w") as f:
-                    f.write(ps_command)
-                
-                if run_command("powershell -ExecutionPolicy Bypass -File create_shortcut.ps1", cwd=project_root):
-                    # Remove the temporary script
-                    os.unlink(os.path.join(project_root, "create_shortcut.ps1"))
-                    
-                    print_success(f"Created desktop shortcut at: {shortcut_path}")
-                    return True
-                else:
-                    print_warning("Failed to create shortcut with PowerShell")
-                    
-                    # Try with a simple copy of the batch file as last resort
-                    shutil.copy(
-                        os.path.join(project_root, "play_gomoku.bat"),
-                        os.path.join(desktop, "Five in a Row.bat")
-                    )
-                    
-                    print_success("Created a batch file on desktop as a shortcut")
-                    return True
+                print_success(f"Created desktop shortcut at: {shortcut_path}")
+                return True
         except Exception as e:
             print_warning(f"Failed to create Windows shortcut: {e}")
             return False
-    elif platform.system() == "Darwin":  # macOS
+    elif SYSTEM == "Darwin":  # macOS
         try:
             # Create a macOS .command file
             command_path = os.path.join(desktop, "Five in a Row.command")
             
             with open(command_path, "w") as f:
                 f.write("#!/bin/bash\n\n")
-                f.write(f"cd \"{project_root}\"\n")
+                f.write(f"cd \"{PROJECT_ROOT}\"\n")
                 f.write("./play_gomoku.sh\n")
             
             # Make it executable
             os.chmod(command_path, 0o755)
             
             # Try to set a custom icon using AppleScript
-            icon_path = os.path.join(project_root, "resources", "gomoku_icon.png")
+            icon_path = os.path.join(PROJECT_ROOT, "resources", "gomoku_icon.png")
             if os.path.exists(icon_path):
                 # Convert PNG to ICNS if needed (simplified)
                 try:
@@ -660,7 +776,7 @@ def create_desktop_shortcut():
                     if image_data:
                         image = Quartz.CIImage.imageWithData_(image_data)
                         if image:
-                            icon_path = os.path.join(project_root, "resources", "gomoku_icon.icns")
+                            icon_path = os.path.join(PROJECT_ROOT, "resources", "gomoku_icon.icns")
                             image.writeToURL_options_colorSpace_(
                                 Cocoa.NSURL.fileURLWithPath_(icon_path),
                                 0,
@@ -699,8 +815,8 @@ def create_desktop_shortcut():
                 f.write("Type=Application\n")
                 f.write("Name=Five in a Row\n")
                 f.write("Comment=Play the classic Gomoku game\n")
-                f.write(f"Exec={os.path.join(project_root, 'play_gomoku.sh')}\n")
-                f.write(f"Icon={os.path.join(project_root, 'resources', 'gomoku_icon.png')}\n")
+                f.write(f"Exec={os.path.join(PROJECT_ROOT, 'play_gomoku.sh')}\n")
+                f.write(f"Icon={os.path.join(PROJECT_ROOT, 'resources', 'gomoku_icon.png')}\n")
                 f.write("Terminal=false\n")
                 f.write("Categories=Game;BoardGame;\n")
             
@@ -717,39 +833,58 @@ def run_cleanup():
     """Clean up temporary files."""
     print_header("Cleaning Up")
     
-    project_root = get_project_root()
-    
-    # List of patterns to clean up
-    cleanup_patterns = [
-        "*.o", "*.obj", "*.pyc", 
-        "__pycache__", "*.log"
-    ]
-    
-    for pattern in cleanup_patterns:
-        if platform.system() == "Windows":
-            run_command(f"del /s /q {pattern}", cwd=project_root, show_output=False)
-        else:
-            run_command(f"find . -name '{pattern}' -delete", cwd=project_root, show_output=False)
+    # Files and directories to clean up; the compiler caches are left alone
+    cleanup_suffixes = {".o", ".obj", ".pyc", ".log"}
+    cleanup_dirs = {"__pycache__"}
+    keep_dirs = {".ccache", ".sccache"}
+    
+    # One in-process walk instead of spawning find/PowerShell
+    for root, dirs, files in os.walk(PROJECT_ROOT):
+        for name in [d for d in dirs if d in cleanup_dirs or d in keep_dirs]:
+            dirs.remove(name)
+            if name in cleanup_dirs:
+                shutil.rmtree(os.path.join(root, name), ignore_errors=True)
+        for name in files:
+            if os.path.splitext(name)[1] in cleanup_suffixes:
+                try:
+                    os.unlink(os.path.join(root, name))
+                except OSError:
+                    pass
     
     print_success("Cleanup completed")
     return True
 
+def everything_fresh():
+    """Check whether the library, resources and launchers from a previous install are all current."""
+    launcher = "play_gomoku.bat" if SYSTEM == "Windows" else "play_gomoku.sh"
+    installed = list_directory(PROJECT_ROOT)
+    return (backend_is_fresh(build_stamp())
+            and "gomoku_icon.png" in list_directory(os.path.join(PROJECT_ROOT, "resources"))
+            and launcher in installed and "play_gomoku.py" in installed)
+
 def main():
     """Main installer function."""
     parser = argparse.ArgumentParser(description="Five in a Row (Gomoku) Installer")
     parser.add_argument("--no-deps", action="store_true", help="Skip installing Python dependencies")
     parser.add_argument("--no-build", action="store_true", help="Skip building C++ backend")
+    parser.add_argument("--force-rebuild", action="store_true", help="Rebuild the C++ backend even if it is up to date")
     parser.add_argument("--no-shortcut", action="store_true", help="Skip creating desktop shortcut")
     parser.add_argument("--no-cleanup", action="store_true", help="Skip cleanup step")
+    parser.add_argument("--fast", action="store_true", default=os.environ.get("CI") == "true",
+                        help="Exit straight away if a previous install is still up to date (default when CI=true)")
     
     args = parser.parse_args()
     
+    if args.fast and not args.force_rebuild and everything_fresh():
+        print_success("Five in a Row is already installed and up to date")
+        return 0
+    
     print_header("Five in a Row (Gomoku) Installer")
     
     # Print system information
-    print(f"Platform: {platform.system()} {platform.release()}")
-    print(f"Python: {platform.python_version()}")
-    print(f"Project root: {get_project_root()}")
+    print(f"Platform: {SYSTEM} {platform.release()}")
+    print(f"Python: {PYTHON_VERSION}")
+    print(f"Project root: {PROJECT_ROOT}")
     print("\nStarting installation...")
     
     # Check prerequisites
@@ -765,21 +900,25 @@ def main():
     else:
         print_step("Skipping Python dependencies installation")
     
-    # Build backend if not skipped
+    # Build the backend (if not skipped) while the resources are set up;
+    # the two steps touch different directories
     if not args.no_build:
-        build_ok = build_backend()
-        if not build_ok:
-            print_error("Failed to build C++ backend")
-            print("Please check the error messages above and make sure you have a C++ compiler and CMake installed.")
-            return 1
+        build_ok, resources_ok = run_alongside(
+            lambda: build_backend(force_rebuild=args.force_rebuild),
+            [setup_resources],
+        )
     else:
         print_step("Skipping C++ backend building")
+        build_ok, resources_ok = True, setup_resources()
     
-    # Set up resources
-    resources_ok = setup_resources()
     if not resources_ok:
         print_warning("Some resources could not be set up")
     
+    if not build_ok:
+        print_error("Failed to build C++ backend")
+        print("Please check the error messages above and make sure you have a C++ compiler and CMake installed.")
+        return 1
+    
     # Create launchers
     launchers_ok = create_launchers()
     if not launchers_ok:
@@ -800,7 +939,7 @@ def main():
     print_header("Installation Complete")
     
     print("You can now run the game with:")
-    if platform.system() == "Windows":
+    if SYSTEM == "Windows":
         print(f"  {Colors.BOLD}play_gomoku.bat{Colors.ENDC}")
     else:
         print(f"  {Colors.BOLD}./play_gomoku.sh{Colors.ENDC}")
@@ -21,6 +21,18 @@ int make_move(void* engine, int row, int col, int player) {
     return static_cast<GomokuEngine*>(engine)->makeMove(row, col, player);
 }
 
+// Make n moves in order, packed as (row, col, player) triples
+int apply_moves(void* engine, const int8_t* moves, int n) {
+    auto* gomoku = static_cast<GomokuEngine*>(engine);
+    int applied = 0;
+    for (int i = 0; i < n; ++i, moves += 3) {
+        if (gomoku->makeMove(moves[0], moves[1], moves[2])) {
+            ++applied;
+        }
+    }
+    return applied;
+}
+
 // Get the best move for AI
 void get_best_move(void* engine, int* row, int* col) {
     auto move = static_cast<GomokuEngine*>(engine)->getBestMove();
@@ -28,6 +40,17 @@ void get_best_move(void* engine, int* row, int* col) {
     *col = move.second;
 }
 
+// Find the AI's best move and make it for player
+int play_best_move(void* engine, int player, int* row, int* col, int* game_over) {
+    auto* gomoku = static_cast<GomokuEngine*>(engine);
+    auto move = gomoku->getBestMove();
+    int moved = move.first >= 0 && move.second >= 0 && gomoku->makeMove(move.first, move.second, player);
+    *row = moved ? move.first : -1;
+    *col = moved ? move.second : -1;
+    *game_over = gomoku->isGameOver() ? 1 : 0;
+    return moved;
+}
+
 // Check if the game is over
 int is_game_over(void* engine) {
     return static_cast<GomokuEngine*>(engine)->isGameOver() ? 1 : 0;
@@ -47,6 +70,16 @@ int get_board_value(void* engine, int row, int col) {
     return -1;
 }
 
+// Copy the whole board, row by row, into out
+void get_board(void* engine, int8_t* out) {
+    const auto& board = static_cast<GomokuEngine*>(engine)->getBoard();
+    for (const auto& row : board) {
+        for (int value : row) {
+            *out++ = static_cast<int8_t>(value);
+        }
+    }
+}
+
 // Set difficulty level
 void set_difficulty(void* engine, int level) {
     GomokuEngine::Difficulty difficulty;
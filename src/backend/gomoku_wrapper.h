@@ -1,6 +1,8 @@
 #ifndef GOMOKU_WRAPPER_H
 #define GOMOKU_WRAPPER_H
 
+#include <stdint.h>
+
 #ifdef __cplusplus
 extern "C" {
 #endif
@@ -17,9 +19,16 @@ void reset_game(void* engine);
 // Make a move
 int make_move(void* engine, int row, int col, int player);
 
+// Make n moves in order, packed as (row, col, player) triples; returns how many were legal
+int apply_moves(void* engine, const int8_t* moves, int n);
+
 // Get the best move for AI
 void get_best_move(void* engine, int* row, int* col);
 
+// Find the AI's best move and make it for player; returns 1 if a move was made.
+// row/col receive the move (-1 if none was possible), game_over whether the game has ended
+int play_best_move(void* engine, int player, int* row, int* col, int* game_over);
+
 // Check if the game is over
 int is_game_over(void* engine);
 
@@ -29,6 +38,9 @@ int get_winner(void* engine);
 // Get the value at a specific board position
 int get_board_value(void* engine, int row, int col);
 
+// Copy the whole board, row by row, into out (BOARD_SIZE * BOARD_SIZE values)
+void get_board(void* engine, int8_t* out);
+
 // Set difficulty level (1 = Easy, 3 = Medium, 5 = Hard)
 void set_difficulty(void* engine, int level);
 
@@ -3,6 +3,7 @@
 Simple script to generate a Gomoku game icon
 """
 
+import hashlib
 from PIL import Image, ImageDraw
 
 def create_gomoku_icon(size=512, output_path=None):
@@ -14,6 +15,7 @@ def create_gomoku_icon(size=512, output_path=None):
     padding = size * 0.1
     board_size = size - 2 * padding
     cell_size = board_size / 8
+    line_width = max(1, int(size/256))
     
     # Draw board background (wooden texture)
     draw.rectangle(
@@ -25,52 +27,27 @@ def create_gomoku_icon(size=512, output_path=None):
     for i in range(9):
         # Horizontal lines
         y = padding + i * cell_size
-        draw.line([(padding, y), (size - padding, y)], fill=(0, 0, 0, 255), width=max(1, int(size/256)))
+        draw.line([(padding, y), (size - padding, y)], fill=(0, 0, 0, 255), width=line_width)
         
         # Vertical lines
         x = padding + i * cell_size
-        draw.line([(x, padding), (x, size - padding)], fill=(0, 0, 0, 255), width=max(1, int(size/256)))
+        draw.line([(x, padding), (x, size - padding)], fill=(0, 0, 0, 255), width=line_width)
     
     # Draw stones
     stone_radius = cell_size * 0.4
     
-    # Black stones
-    draw.ellipse(
-        [(padding + 2*cell_size - stone_radius, padding + 2*cell_size - stone_radius),
-         (padding + 2*cell_size + stone_radius, padding + 2*cell_size + stone_radius)],
-        fill=(0, 0, 0, 255)
-    )
-    
-    draw.ellipse(
-        [(padding + 6*cell_size - stone_radius, padding + 4*cell_size - stone_radius),
-         (padding + 6*cell_size + stone_radius, padding + 4*cell_size + stone_radius)],
-        fill=(0, 0, 0, 255)
-    )
+    def stone_box(col, row):
+        x = padding + col * cell_size
+        y = padding + row * cell_size
+        return [(x - stone_radius, y - stone_radius), (x + stone_radius, y + stone_radius)]
     
-    draw.ellipse(
-        [(padding + 4*cell_size - stone_radius, padding + 6*cell_size - stone_radius),
-         (padding + 4*cell_size + stone_radius, padding + 6*cell_size + stone_radius)],
-        fill=(0, 0, 0, 255)
-    )
+    # Black stones
+    for col, row in ((2, 2), (6, 4), (4, 6)):
+        draw.ellipse(stone_box(col, row), fill=(0, 0, 0, 255))
     
     # White stones with black outline
-    draw.ellipse(
-        [(padding + 4*cell_size - stone_radius, padding + 2*cell_size - stone_radius),
-         (padding + 4*cell_size + stone_radius, padding + 2*cell_size + stone_radius)],
-        fill=(255, 255, 255, 255), outline=(0, 0, 0, 255), width=max(1, int(size/256))
-    )
-    
-    draw.ellipse(
-        [(padding + 2*cell_size - stone_radius, padding + 4*cell_size - stone_radius),
-         (padding + 2*cell_size + stone_radius, padding + 4*cell_size + stone_radius)],
-        fill=(255, 255, 255, 255), outline=(0, 0, 0, 255), width=max(1, int(size/256))
-    )
-    
-    draw.ellipse(
-        [(padding + 6*cell_size - stone_radius, padding + 6*cell_size - stone_radius),
-         (padding + 6*cell_size + stone_radius, padding + 6*cell_size + stone_radius)],
-        fill=(255, 255, 255, 255), outline=(0, 0, 0, 255), width=max(1, int(size/256))
-    )
+    for col, row in ((4, 2), (2, 4), (6, 6)):
+        draw.ellipse(stone_box(col, row), fill=(255, 255, 255, 255), outline=(0, 0, 0, 255), width=line_width)
     
     # Save the image
     if output_path:
@@ -78,15 +55,36 @@ def create_gomoku_icon(size=512, output_path=None):
     
     return image
 
+def file_sha256(path):
+    """Return the SHA-256 hex digest of a file's contents."""
+    with open(path, 'rb') as f:
+        if hasattr(hashlib, 'file_digest'):  # Python 3.11+
+            return hashlib.file_digest(f, 'sha256').hexdigest()
+        return hashlib.sha256(f.read()).hexdigest()
+
 if __name__ == "__main__":
     import os
     
     resources_dir = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'resources')
     
     # Create resources directory if it doesn't exist
-    if not os.path.exists(resources_dir):
-        os.makedirs(resources_dir)
+    os.makedirs(resources_dir, exist_ok=True)
     
     icon_path = os.path.join(resources_dir, 'gomoku_icon.png')
-    create_gomoku_icon(512, icon_path)
-    print(f"Icon created at: {icon_path}")
+    
+    # Skip regeneration if this exact script already produced the icon
+    script_hash = file_sha256(__file__)
+    stamp_path = os.path.join(resources_dir, '.create_icon.sha')
+    try:
+        with open(stamp_path) as f:
+            up_to_date = f.read().strip() == script_hash and os.path.isfile(icon_path)
+    except OSError:
+        up_to_date = False
+    
+    if up_to_date:
+        print(f"Icon is up to date at: {icon_path}")
+    else:
+        create_gomoku_icon(512, icon_path)
+        with open(stamp_path, 'w') as f:
+            f.write(script_hash + "\n")
+        print(f"Icon created at: {icon_path}")
@@ -1,67 +1,137 @@
 # Simple program to generate sound effect WAV files for the Gomoku game
 import os
-from scipy.io.wavfile import write
-import numpy as np
+import sys
+import hashlib
+import functools
+from concurrent.futures import ThreadPoolExecutor
 
 # Create resources directory if it doesn't exist
 resources_dir = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'resources')
-if not os.path.exists(resources_dir):
+try:
     os.makedirs(resources_dir)
     print(f"Created resources directory: {resources_dir}")
+except FileExistsError:
+    pass
 
-# Function to generate a simple tone with fade in/out
-def generate_tone(frequency, duration, fade=0.1, volume=0.5, sample_rate=44100):
-    t = np.linspace(0, duration, int(sample_rate * duration), False)
-    tone = np.sin(frequency * 2 * np.pi * t) * volume
-    
-    # Apply fade in/out
-    fade_samples = int(fade * sample_rate)
-    fade_in = np.linspace(0, 1, fade_samples)
-    fade_out = np.linspace(1, 0, fade_samples)
-    
-    tone[:fade_samples] *= fade_in
-    tone[-fade_samples:] *= fade_out
-    
-    # Convert to int16 range
-    return (tone * 32767).astype(np.int16)
-
-# Generate player move sound - higher pitch click
-player_move = generate_tone(800, 0.15, fade=0.05, volume=0.3)
-write(os.path.join(resources_dir, "player_move.wav"), 44100, player_move)
-print(f"Created sound effect: {os.path.join(resources_dir, 'player_move.wav')}")
-
-# Generate AI move sound - lower pitch click
-ai_move = generate_tone(400, 0.2, fade=0.05, volume=0.3)  
-write(os.path.join(resources_dir, "ai_move.wav"), 44100, ai_move)
-print(f"Created sound effect: {os.path.join(resources_dir, 'ai_move.wav')}")
-
-# Generate win sound - happy ascending tones
-t = np.linspace(0, 1.0, 44100, False)
-win = np.zeros(44100, dtype=np.float64)
-for f in [400, 500, 600, 800, 1000]:
-    win += np.sin(f * 2 * np.pi * t) * 0.1
+SOUND_FILES = ("player_move.wav", "ai_move.wav", "win.wav", "lose.wav")
+
+# IEEE float WAVs skip quantisation entirely, but not every player handles
+# them, so integer PCM stays the default
+FLOAT_WAV = os.environ.get('GOMOKU_FLOAT_WAV') == '1'
+
+# Function to hash a file's contents
+def file_sha256(path):
+    with open(path, 'rb') as f:
+        if hasattr(hashlib, 'file_digest'):  # Python 3.11+
+            return hashlib.file_digest(f, 'sha256').hexdigest()
+        return hashlib.sha256(f.read()).hexdigest()
+
+# Skip regeneration if this exact script already produced all the sounds;
+# checked before importing NumPy/SciPy so the common case stays cheap
+script_hash = file_sha256(__file__) + ("-float" if FLOAT_WAV else "")
+stamp_path = os.path.join(resources_dir, '.generate_sounds.sha')
+try:
+    with open(stamp_path) as f:
+        up_to_date = f.read().strip() == script_hash
+except OSError:
+    up_to_date = False
+if up_to_date and all(os.path.isfile(os.path.join(resources_dir, name)) for name in SOUND_FILES):
+    print("Sound files are up to date in the resources directory")
+    sys.exit(0)
+
+from scipy.io.wavfile import write
+from scipy.signal import lfilter
+import numpy as np
+
+SAMPLE_RATE = 44100
+CLICK_SAMPLE_RATE = 22050  # Short UI clicks don't need full bandwidth
+FULL_SCALE = 1.0 if FLOAT_WAV else 32767
+
+# Gain envelope with the fades and the output full-scale factor folded in,
+# built once per sound shape
+@functools.lru_cache(maxsize=8)
+def envelope(n, fade_samples, gain):
+    env = np.full(n, gain * FULL_SCALE)
+    env[:fade_samples] *= np.linspace(0, 1, fade_samples)
+    env[-fade_samples:] *= np.linspace(1, 0, fade_samples)
+    return env
+
+# Function to apply the envelope and convert to int16, rounding and clipping
+# rather than letting the cast wrap around (the signal buffer is reused)
+def to_pcm(signal, fade_samples, gain=1.0):
+    if FLOAT_WAV:
+        # Envelope and narrow to float32 in the same pass; nothing to round
+        pcm = np.empty(len(signal), dtype=np.float32)
+        np.multiply(signal, envelope(len(signal), fade_samples, gain), out=pcm)
+        return pcm
     
-# Apply fade in/out
-fade_samples = int(0.1 * 44100)
-fade_in = np.linspace(0, 1, fade_samples)
-fade_out = np.linspace(1, 0, fade_samples)
-win[:fade_samples] *= fade_in
-win[-fade_samples:] *= fade_out
-
-write(os.path.join(resources_dir, "win.wav"), 44100, (win * 32767).astype(np.int16))
-print(f"Created sound effect: {os.path.join(resources_dir, 'win.wav')}")
-
-# Generate lose sound - descending tones
-t = np.linspace(0, 1.0, 44100, False)
-lose = np.zeros(44100, dtype=np.float64)
-for f in [600, 500, 400, 300, 200]:
-    lose += np.sin(f * 2 * np.pi * t) * 0.1
+    pcm = np.empty(len(signal), dtype=np.int16)
+    np.multiply(signal, envelope(len(signal), fade_samples, gain), out=signal)
+    np.rint(signal, out=signal)
+    np.clip(signal, -32768, 32767, out=pcm, casting='unsafe')
+    return pcm
+
+# Function to reduce int16 samples to 8-bit unsigned PCM, rounding to nearest
+def to_pcm8(pcm):
+    if FLOAT_WAV:
+        return pcm
+    return np.minimum((pcm.astype(np.int32) + 32768 + 128) >> 8, 255).astype(np.uint8)
+
+# Function to generate a sine wave with the recurrence s[n] = 2cos(w)s[n-1] - s[n-2],
+# run as an IIR filter over an impulse so no per-sample sin() is needed
+def sinosc(frequency, n, sample_rate=SAMPLE_RATE):
+    w = 2 * np.pi * frequency / sample_rate
+    impulse = np.zeros(n)
+    impulse[0] = 1.0
+    return lfilter([0.0, np.sin(w)], [1.0, -2 * np.cos(w), 1.0], impulse)
+
+# Function to generate a simple tone with fade in/out
+def generate_tone(frequency, duration, fade=0.1, volume=0.5, sample_rate=SAMPLE_RATE):
+    tone = sinosc(frequency, int(sample_rate * duration), sample_rate)
     
-# Apply fade in/out
-lose[:fade_samples] *= fade_in
-lose[-fade_samples:] *= fade_out
+    # Apply volume and fade in/out, converting to int16 range
+    return to_pcm(tone, int(fade * sample_rate), volume)
+
+# Function to synthesise chords of equal-amplitude partials, one row per chord,
+# with a single batched inverse FFT: each partial is one spectral bin
+# (snapped to the nearest 1/duration Hz)
+def additive(chords, duration=1.0, sample_rate=SAMPLE_RATE):
+    n = int(sample_rate * duration)
+    spectra = np.zeros((len(chords), n // 2 + 1), dtype=np.complex128)
+    for spectrum, freqs in zip(spectra, chords):
+        for f in freqs:
+            spectrum[round(f * n / sample_rate)] += -0.5j * n  # Unit-amplitude sine
+    return np.fft.irfft(spectra, n)
+
+# Function to synthesise one sound and write it to the resources directory
+def make_sound(name, sample_rate, synthesize):
+    path = os.path.join(resources_dir, name)
+    write(path, sample_rate, synthesize())
+    return path
+
+fade_samples = int(0.1 * SAMPLE_RATE)
+# Win sound rises, lose sound falls; both chords come out of one transform
+win_mix, lose_mix = additive([[400, 500, 600, 800, 1000], [600, 500, 400, 300, 200]])
+sounds = [
+    # Player move sound - higher pitch click, 22.05 kHz 8-bit
+    ("player_move.wav", CLICK_SAMPLE_RATE,
+     lambda: to_pcm8(generate_tone(800, 0.15, fade=0.05, volume=0.3, sample_rate=CLICK_SAMPLE_RATE))),
+    # AI move sound - lower pitch click, 22.05 kHz 8-bit
+    ("ai_move.wav", CLICK_SAMPLE_RATE,
+     lambda: to_pcm8(generate_tone(400, 0.2, fade=0.05, volume=0.3, sample_rate=CLICK_SAMPLE_RATE))),
+    # Win sound - happy ascending tones
+    ("win.wav", SAMPLE_RATE, lambda: to_pcm(win_mix, fade_samples, 0.1)),
+    # Lose sound - descending tones
+    ("lose.wav", SAMPLE_RATE, lambda: to_pcm(lose_mix, fade_samples, 0.1)),
+]
+
+# The sounds are independent and NumPy/SciPy release the GIL, so build and
+# write them in parallel; results come back in order for the log
+with ThreadPoolExecutor(max_workers=len(sounds)) as executor:
+    for path in executor.map(lambda sound: make_sound(*sound), sounds):
+        print(f"Created sound effect: {path}")
 
-write(os.path.join(resources_dir, "lose.wav"), 44100, (lose * 32767).astype(np.int16))
-print(f"Created sound effect: {os.path.join(resources_dir, 'lose.wav')}")
+with open(stamp_path, 'w') as f:
+    f.write(script_hash + "\n")
 
 print("Sound files generated successfully in the resources directory!")
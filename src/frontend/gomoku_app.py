@@ -3,14 +3,118 @@ import os
 import ctypes
 import json
 import time
-import platform
-from ctypes import c_void_p, c_int, POINTER, byref
-from PyQt5.QtWidgets import (QApplication, QMainWindow, QWidget, QGridLayout, QPushButton,
+import functools
+import logging
+from bisect import bisect_right
+from itertools import chain
+from ctypes import c_void_p, c_int, c_int8, POINTER, byref
+from PyQt5.QtWidgets import (QApplication, QMainWindow, QWidget, QPushButton,
                            QLabel, QMessageBox, QVBoxLayout, QHBoxLayout, QComboBox,
                            QGroupBox, QFrame, QAction, QFileDialog, QDialog, QTextBrowser,
                            QCheckBox)
-from PyQt5.QtCore import Qt, QSize, QTimer, QDateTime, pyqtSignal
-from PyQt5.QtGui import QPainter, QBrush, QPen, QColor, QRadialGradient, QIcon
+from PyQt5.QtCore import (Qt, QSize, QTimer, QElapsedTimer, QDateTime, QRect, QObject, QRunnable,
+                          QThreadPool, pyqtSignal)
+from PyQt5.QtGui import QPainter, QBrush, QPen, QColor, QRadialGradient, QIcon, QPixmap
+
+from setup_resources import list_dir_names
+
+# orjson is optional; it encodes and decodes save and settings files faster than the json module.
+# Both pairs work on UTF-8 bytes so files are read and written in one call
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+if orjson:
+    _json_dumps = orjson.dumps
+    _json_loads = orjson.loads
+else:
+    def _json_dumps(obj):
+        return json.dumps(obj).encode('utf-8')
+    _json_loads = json.loads
+
+# Settings save/load messages; debug output is only formatted when enabled
+_log = logging.getLogger(__name__)
+
+# Board dimension, shared with the C++ backend; a module global so hot loops avoid class lookups
+BOARD_SIZE = 15
+
+# Directories resolved once at import time
+_FRONTEND_DIR = os.path.dirname(os.path.abspath(__file__))
+_PROJECT_ROOT = os.path.dirname(_FRONTEND_DIR)
+_REPO_ROOT = os.path.dirname(_PROJECT_ROOT)
+
+# Places a resource file may live, in order of preference
+_RESOURCE_DIRS = (
+    os.path.join(_PROJECT_ROOT, 'resources'),
+    os.path.join(_PROJECT_ROOT, 'src', 'resources'),
+    os.path.join(_PROJECT_ROOT, '..', 'resources')
+)
+
+# Candidate settings files, one per resource directory
+_SETTINGS_PATHS = tuple(os.path.join(d, 'settings.json') for d in _RESOURCE_DIRS)
+
+
+@functools.lru_cache(maxsize=None)
+def _dir_entries(directory):
+    """Return the names in a directory, listed once; empty if it can't be read"""
+    return frozenset(list_dir_names(directory) or ())
+
+
+@functools.lru_cache(maxsize=None)
+def _find_resource(name):
+    """Return the first existing path of a resource file, or None; looked up once per name"""
+    for resource_dir in _RESOURCE_DIRS:
+        if name in _dir_entries(resource_dir):
+            return os.path.join(resource_dir, name)
+    return None
+
+
+@functools.lru_cache(maxsize=None)
+def _status_message(version="1.0.0"):
+    """Return the status-bar greeting; the platform details are read once per process"""
+    # Same values as platform.system()/python_version(), without importing platform at startup
+    platform_name = os.uname().sysname if hasattr(os, 'uname') else 'Windows'
+    python_version = ".".join(map(str, sys.version_info[:3]))
+    return f"Ready | Five in a Row v{version} | {platform_name} | Python {python_version}"
+
+
+class _IconCache:
+    """Decoded icons shared by every window, keyed by file path"""
+    
+    _icons = {}
+    
+    @classmethod
+    def get(cls, path):
+        icon = cls._icons.get(path)
+        if icon is None:
+            icon = cls._icons[path] = QIcon(path)
+        return icon
+
+
+class _IconGenTask(QRunnable):
+    """Generates the application icon on a pool thread and reports the path
+    (or "" on failure) through the finished signal"""
+    
+    class _Signals(QObject):
+        finished = pyqtSignal(str)
+    
+    def __init__(self, icon_path):
+        super().__init__()
+        self.icon_path = icon_path
+        self.signals = self._Signals()
+        self.finished = self.signals.finished
+    
+    def run(self):
+        try:
+            import create_icon
+            create_icon.create_gomoku_icon(512, self.icon_path)
+        except ImportError as e:
+            print(f"Error importing create_icon module: {e}")
+            self.finished.emit("")
+            return
+        self.finished.emit(self.icon_path)
+
 
 class GomokuEngine:
     """Python wrapper for the C++ backend"""
@@ -18,21 +122,29 @@ class GomokuEngine:
     EMPTY = 0
     PLAYER = 1
     AI = 2
-    BOARD_SIZE = 15
+    BOARD_SIZE = BOARD_SIZE
     
     # Difficulty constants
     EASY = 1
     MEDIUM = 3
     HARD = 5
     
-    def __init__(self):
+    # The loaded library, shared by every engine in the process
+    _lib = None
+    
+    @classmethod
+    def _get_lib(cls):
+        """Load the shared library and declare its prototypes, once per process"""
+        if cls._lib is not None:
+            return cls._lib
+        
         # Load the shared library
         if sys.platform.startswith('darwin'):
             # On macOS, try several possible library locations
             possible_paths = [
-                os.path.join(os.path.dirname(os.path.abspath(__file__)), '../lib/libgomoku.dylib'),
-                os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))), 'lib/libgomoku.dylib'),
-                os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))), 'build/libgomoku.dylib')
+                os.path.join(_FRONTEND_DIR, '../lib/libgomoku.dylib'),
+                os.path.join(_REPO_ROOT, 'lib/libgomoku.dylib'),
+                os.path.join(_REPO_ROOT, 'build/libgomoku.dylib')
             ]
             lib_path = None
             for path in possible_paths:
@@ -44,55 +156,81 @@ class GomokuEngine:
                 lib_path = possible_paths[0]
                 print(f"Warning: Library not found in any of the expected locations. Will try: {lib_path}")
         elif sys.platform.startswith('linux'):
-            lib_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), '../lib/libgomoku.so')
+            lib_path = os.path.join(_FRONTEND_DIR, '../lib/libgomoku.so')
         elif sys.platform.startswith('win'):
-            lib_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), '../lib/gomoku.dll')
+            lib_path = os.path.join(_FRONTEND_DIR, '../lib/gomoku.dll')
         else:
             raise OSError("Unsupported platform")
         
         print(f"Attempting to load library from: {lib_path}")
         try:
-            self.lib = ctypes.CDLL(lib_path)
+            lib = ctypes.CDLL(lib_path)
             print("Library loaded successfully!")
         except OSError as e:
             print(f"Error loading library: {e}")
             print("Trying alternative methods to find the library...")
             
             # Try to locate the library in the build directory
-            project_root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+            project_root = _REPO_ROOT
             build_lib_path = os.path.join(project_root, 'build', 'libgomoku.dylib')
             print(f"Trying: {build_lib_path}")
             
             try:
-                self.lib = ctypes.CDLL(build_lib_path)
+                lib = ctypes.CDLL(build_lib_path)
                 print("Library loaded from build directory!")
             except OSError as e2:
                 print(f"Failed to load from build directory: {e2}")
                 raise e  # Re-raise the original exception
         
         # Define function prototypes
-        self.lib.create_engine.restype = c_void_p
-        self.lib.destroy_engine.argtypes = [c_void_p]
-        self.lib.reset_game.argtypes = [c_void_p]
-        self.lib.make_move.argtypes = [c_void_p, c_int, c_int, c_int]
-        self.lib.make_move.restype = c_int
-        self.lib.get_best_move.argtypes = [c_void_p, POINTER(c_int), POINTER(c_int)]
-        self.lib.is_game_over.argtypes = [c_void_p]
-        self.lib.is_game_over.restype = c_int
-        self.lib.get_winner.argtypes = [c_void_p]
-        self.lib.get_winner.restype = c_int
-        self.lib.get_board_value.argtypes = [c_void_p, c_int, c_int]
-        self.lib.get_board_value.restype = c_int
-        self.lib.set_difficulty.argtypes = [c_void_p, c_int]
-        self.lib.get_difficulty.argtypes = [c_void_p]
-        self.lib.get_difficulty.restype = c_int
-        self.lib.undo_move.argtypes = [c_void_p]
-        self.lib.undo_move.restype = c_int
-        self.lib.can_undo.argtypes = [c_void_p]
-        self.lib.can_undo.restype = c_int
-        
-        # Create an engine instance
-        self.engine = self.lib.create_engine()
+        lib.create_engine.restype = c_void_p
+        lib.destroy_engine.argtypes = [c_void_p]
+        lib.reset_game.argtypes = [c_void_p]
+        lib.make_move.argtypes = [c_void_p, c_int, c_int, c_int]
+        lib.make_move.restype = c_int
+        lib.apply_moves.argtypes = [c_void_p, POINTER(c_int8), c_int]
+        lib.apply_moves.restype = c_int
+        lib.get_best_move.argtypes = [c_void_p, POINTER(c_int), POINTER(c_int)]
+        lib.play_best_move.argtypes = [c_void_p, c_int, POINTER(c_int), POINTER(c_int), POINTER(c_int)]
+        lib.play_best_move.restype = c_int
+        lib.is_game_over.argtypes = [c_void_p]
+        lib.is_game_over.restype = c_int
+        lib.get_winner.argtypes = [c_void_p]
+        lib.get_winner.restype = c_int
+        lib.get_board_value.argtypes = [c_void_p, c_int, c_int]
+        lib.get_board_value.restype = c_int
+        lib.get_board.argtypes = [c_void_p, POINTER(c_int8)]
+        lib.get_board.restype = None
+        lib.set_difficulty.argtypes = [c_void_p, c_int]
+        lib.get_difficulty.argtypes = [c_void_p]
+        lib.get_difficulty.restype = c_int
+        lib.undo_move.argtypes = [c_void_p]
+        lib.undo_move.restype = c_int
+        lib.can_undo.argtypes = [c_void_p]
+        lib.can_undo.restype = c_int
+        
+        cls._lib = lib
+        return lib
+    
+    def __init__(self):
+        self.lib = GomokuEngine._get_lib()
+        
+        # Create an engine instance; keep the handle as a c_void_p so ctypes
+        # passes it straight through instead of converting an int per call
+        self.engine = c_void_p(self.lib.create_engine())
+        
+        # Reused by get_board so a full snapshot is one FFI call, not 225
+        self._board_buf = (c_int8 * (BOARD_SIZE * BOARD_SIZE))()
+        # Zero-copy BOARD_SIZE x BOARD_SIZE view of the same buffer
+        self._board_view = memoryview(self._board_buf).cast('B').cast('b', (BOARD_SIZE, BOARD_SIZE))
+        
+        # Output cells for get_best_move/play_best_move, allocated and wrapped once
+        self._out_row = c_int()
+        self._out_col = c_int()
+        self._out_game_over = c_int()
+        self._out_row_ref = byref(self._out_row)
+        self._out_col_ref = byref(self._out_col)
+        self._out_game_over_ref = byref(self._out_game_over)
     
     def __del__(self):
         if hasattr(self, 'lib') and hasattr(self, 'engine'):
@@ -104,11 +242,22 @@ class GomokuEngine:
     def make_move(self, row, col, player):
         return bool(self.lib.make_move(self.engine, row, col, player))
     
+    def apply_moves(self, moves):
+        """Make a sequence of (row, col, player) moves in a single FFI call"""
+        count = len(moves)
+        packed = (c_int8 * (3 * count))(*chain.from_iterable(moves))
+        return self.lib.apply_moves(self.engine, packed, count)
+    
     def get_best_move(self):
-        row = c_int()
-        col = c_int()
-        self.lib.get_best_move(self.engine, byref(row), byref(col))
-        return row.value, col.value
+        self.lib.get_best_move(self.engine, self._out_row_ref, self._out_col_ref)
+        return self._out_row.value, self._out_col.value
+    
+    def play_best_move(self, player):
+        """Find the AI's best move and make it for player in a single FFI call.
+        Returns (row, col, game_over); row and col are -1 if no move was possible"""
+        self.lib.play_best_move(self.engine, player, self._out_row_ref, self._out_col_ref,
+                                self._out_game_over_ref)
+        return self._out_row.value, self._out_col.value, bool(self._out_game_over.value)
     
     def is_game_over(self):
         return bool(self.lib.is_game_over(self.engine))
@@ -119,6 +268,16 @@ class GomokuEngine:
     def get_board_value(self, row, col):
         return self.lib.get_board_value(self.engine, row, col)
     
+    def get_board(self):
+        """Return the whole board as a flat row-major buffer of BOARD_SIZE**2 values"""
+        self.lib.get_board(self.engine, self._board_buf)
+        return self._board_buf
+    
+    def get_board_view(self):
+        """Return the whole board as a 2D memoryview, refreshed in place on every call"""
+        self.lib.get_board(self.engine, self._board_buf)
+        return self._board_view
+    
     def set_difficulty(self, level):
         self.lib.set_difficulty(self.engine, level)
     
@@ -132,71 +291,232 @@ class GomokuEngine:
         return bool(self.lib.can_undo(self.engine))
 
 
-class BoardCell(QPushButton):
-    """A cell in the Gomoku board"""
+class GomokuBoard(QWidget):
+    """The Gomoku board widget"""
     
-    def __init__(self, row, col):
-        super().__init__()
-        self.row = row
-        self.col = col
-        self.value = GomokuEngine.EMPTY
-        self.is_recent_move = False  # Track if this is the most recent move
-        self.setFixedSize(40, 40)
-        self.setStyleSheet("""
-            QPushButton {
-                background-color: #E0B879;
-                border: none;
-            }
-            QPushButton:focus {
-                border: 2px solid #FF5733;
-            }
-        """)
-        self.setFlat(True)
-        self.setCursor(Qt.PointingHandCursor)
-        self.setFocusPolicy(Qt.StrongFocus)  # Enable keyboard focus
+    # Signal to update the game timer
+    move_made = pyqtSignal()
     
-    def set_value(self, value, is_recent=False):
-        self.value = value
-        self.is_recent_move = is_recent
-        self.update()
+    # Game modes
+    MODE_PLAYER_VS_AI = 0
+    MODE_PLAYER_VS_PLAYER = 1
+    MODE_AI_VS_AI = 2
     
-    def set_recent(self, is_recent):
-        self.is_recent_move = is_recent
-        self.update()
+    # Size of one cell in pixels when the board is not squeezed
+    CELL_SIZE = 40
     
-    def paintEvent(self, event):
-        super().paintEvent(event)
-        painter = QPainter(self)
-        painter.setRenderHint(QPainter.Antialiasing)
+    # Pre-rendered stones keyed by (value, is_recent), and the device pixel ratio they were built for
+    _pixmaps = None
+    _pixmap_ratio = None
+    
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.init_ui()
+        self.engine = GomokuEngine()
         
-        # Draw the grid lines
-        painter.setPen(QPen(QColor(0, 0, 0), 1))
+        # Bound engine calls used on every move
+        self._make_move = self.engine.make_move
+        self._is_game_over = self.engine.is_game_over
+        self._play_best = self.engine.play_best_move
         
-        # Draw horizontal line - cast float to int to fix type error
-        painter.drawLine(0, int(self.height() / 2), self.width(), int(self.height() / 2))
+        # Resolve the window callbacks once; the board is reparented into a layout later,
+        # so self.parent() is not the window by the time a game is played. Without a window
+        # they do nothing, so callers never need to check for them
+        self._update_status = getattr(parent, 'update_status', lambda message: None)
+        self._update_statistics = getattr(parent, 'update_statistics', lambda *stats: None)
+        self.player_turn = True
+        self.game_in_progress = False
+        self.game_mode = self.MODE_PLAYER_VS_AI  # Default mode
+        
+        # Game statistics
+        self.games_played = 0
+        self.player_wins = 0
+        self.ai_wins = 0
+        self.draws = 0
         
-        # Draw vertical line - cast float to int to fix type error
-        painter.drawLine(int(self.width() / 2), 0, int(self.width() / 2), self.height())
+        # Move history
+        self.move_history = []  # List of (row, col, player) tuples
+        self.current_move_index = -1  # Current position in replay
+        self.replay_mode = False  # Whether currently in replay mode
+        self.last_move_position = None  # (row, col) of the last move
         
-        # Check if this is an edge cell and only draw inner half of grid lines
-        if self.row == 0:
-            # First row only draws bottom half
-            painter.drawLine(int(self.width() / 2), int(self.height() / 2), int(self.width() / 2), self.height())
+        # For keyboard navigation
+        self.setFocusPolicy(Qt.StrongFocus)
+        self.current_focus = (7, 7)  # Center cell
         
-        if self.row == GomokuEngine.BOARD_SIZE - 1:
-            # Last row only draws top half
-            painter.drawLine(int(self.width() / 2), 0, int(self.width() / 2), int(self.height() / 2))
-            
-        if self.col == 0:
-            # First column only draws right half
-            painter.drawLine(int(self.width() / 2), int(self.height() / 2), self.width(), int(self.height() / 2))
-            
-        if self.col == GomokuEngine.BOARD_SIZE - 1:
-            # Last column only draws left half
-            painter.drawLine(0, int(self.height() / 2), int(self.width() / 2), int(self.height() / 2))
+        # One reusable timer paces the moves of an AI vs AI game
+        self._ai_timer = QTimer(self)
+        self._ai_timer.setSingleShot(True)
+        self._ai_timer.setInterval(500)
+        self._ai_timer.timeout.connect(self.ai_move)
+    
+    def init_ui(self):
+        # One widget draws the whole board; stone values are kept row by row
+        self._stones = bytearray(BOARD_SIZE * BOARD_SIZE)
+        self._recent = None  # (row, col) of the highlighted stone
+        
+        # Cell positions and the board background, computed lazily for the current size
+        self._cell_x = None
+        self._cell_y = None
+        self._cell_rects = None  # Flat, indexed by row * BOARD_SIZE + col
+        self._stone_rects = None
+        self._grid_pixmap = None
+        
+        self.setContentsMargins(9, 9, 9, 9)
+        self.setCursor(Qt.PointingHandCursor)
+    
+    def sizeHint(self):
+        margins = self.contentsMargins()
+        size = BOARD_SIZE * self.CELL_SIZE
+        return QSize(size + margins.left() + margins.right(), size + margins.top() + margins.bottom())
+    
+    def layout_cells(self):
+        """Spread the cells evenly over the widget, overlapping them if space is short"""
+        area = self.contentsRect()
+        last = BOARD_SIZE - 1
+        step_x = (area.width() - self.CELL_SIZE) / last
+        step_y = (area.height() - self.CELL_SIZE) / last
+        self._cell_x = [area.left() + round(i * step_x) for i in range(last + 1)]
+        self._cell_y = [area.top() + round(i * step_y) for i in range(last + 1)]
+        self._cell_rects = [QRect(x, y, self.CELL_SIZE, self.CELL_SIZE) for y in self._cell_y for x in self._cell_x]
+        self._stone_rects = [rect.adjusted(5, 5, -5, -5) for rect in self._cell_rects]
+    
+    def cell_rect(self, row, col):
+        """Return the area of the widget covered by a cell"""
+        if self._cell_rects is None:
+            self.layout_cells()
+        return self._cell_rects[row * BOARD_SIZE + col]
+    
+    def stone_rect(self, row, col):
+        """Return the part of a cell covered by a stone and its recent-move outline"""
+        if self._stone_rects is None:
+            self.layout_cells()
+        return self._stone_rects[row * BOARD_SIZE + col]
+    
+    def cell_at(self, pos):
+        """Return the (row, col) of the cell nearest to a point on the board, or None"""
+        if self._cell_rects is None:
+            self.layout_cells()
+        half = self.CELL_SIZE // 2
+        col = min(range(BOARD_SIZE), key=lambda i: abs(self._cell_x[i] + half - pos.x()))
+        row = min(range(BOARD_SIZE), key=lambda i: abs(self._cell_y[i] + half - pos.y()))
+        if self.cell_rect(row, col).contains(pos):
+            return row, col
+        return None
+    
+    def set_cell(self, row, col, value, is_recent=False):
+        """Show a stone (or EMPTY) in a cell, optionally as the recent move"""
+        self._stones[row * BOARD_SIZE + col] = value
+        self.set_recent(row, col, is_recent)
+    
+    def clear_cells(self):
+        """Remove every stone from the board and repaint it once"""
+        self._stones[:] = bytes(len(self._stones))
+        self._recent = None
+        self.update()
+    
+    def load_cells(self, recent):
+        """Copy every stone from the engine's board and repaint once,
+        highlighting recent ((row, col) or None)"""
+        self._stones[:] = bytes(self.engine.get_board())
+        self._recent = recent
+        self.update()
+    
+    def set_recent(self, row, col, is_recent):
+        """Turn the recent-move outline of a cell on or off"""
+        if is_recent:
+            if self._recent and self._recent != (row, col):
+                self.update(self.stone_rect(*self._recent))
+            self._recent = (row, col)
+        elif self._recent == (row, col):
+            self._recent = None
+        self.update(self.stone_rect(row, col))
+    
+    def resizeEvent(self, event):
+        # Cell positions may have moved, so the layout and cached grid must be rebuilt
+        self._cell_x = self._cell_y = None
+        self._cell_rects = self._stone_rects = None
+        self._grid_pixmap = None
+        super().resizeEvent(event)
+    
+    def render_grid(self):
+        """Render the board background and grid lines behind the cells into a pixmap"""
+        first = self.cell_rect(0, 0)
+        last = self.cell_rect(BOARD_SIZE - 1, BOARD_SIZE - 1)
+        origin = first.topLeft()
+        width = last.right() - first.left() + 1
+        height = last.bottom() - first.top() + 1
+        
+        pixmap = QPixmap(width, height)
+        pixmap.fill(QColor("#E0B879"))
+        
+        # Axis-aligned one pixel lines look the same without antialiasing
+        painter = QPainter(pixmap)
+        painter.setPen(QPen(QColor(0, 0, 0), 1))
+        for col in range(BOARD_SIZE):
+            x = self.cell_rect(0, col).center().x() - origin.x()
+            painter.drawLine(x, 0, x, height)
+        for row in range(BOARD_SIZE):
+            y = self.cell_rect(row, 0).center().y() - origin.y()
+            painter.drawLine(0, y, width, y)
+        painter.end()
+        
+        return origin, pixmap
+    
+    def paintEvent(self, event):
+        if self._grid_pixmap is None:
+            self._grid_pixmap = self.render_grid()
+        origin, pixmap = self._grid_pixmap
+        painter = QPainter(self)
         
-        # Draw stone if not empty
-        if self.value == GomokuEngine.PLAYER:
+        # Only repaint what Qt asked for: a move or highlight change dirties a cell or two
+        dirty = event.rect()
+        target = dirty.intersected(QRect(origin, pixmap.size()))
+        if not target.isEmpty():
+            painter.drawPixmap(target, pixmap, target.translated(-origin.x(), -origin.y()))
+        
+        # Stones in the cells overlapping the dirty area
+        pixmaps = self._ensure_stone_pixmaps(self.devicePixelRatioF())
+        rects = self._cell_rects
+        stones = self._stones
+        recent = self._recent[0] * BOARD_SIZE + self._recent[1] if self._recent else -1
+        first_col = bisect_right(self._cell_x, dirty.left() - self.CELL_SIZE)
+        last_col = bisect_right(self._cell_x, dirty.right())
+        for row in range(bisect_right(self._cell_y, dirty.top() - self.CELL_SIZE),
+                         bisect_right(self._cell_y, dirty.bottom())):
+            row_start = row * BOARD_SIZE
+            for index in range(row_start + first_col, row_start + last_col):
+                value = stones[index]
+                if value:
+                    painter.drawPixmap(rects[index].topLeft(), pixmaps[(value, index == recent)])
+        
+        # Keyboard focus
+        if self.hasFocus():
+            painter.setPen(QPen(QColor("#FF5733"), 2))
+            painter.drawRect(self.cell_rect(*self.current_focus).adjusted(1, 1, -1, -1))
+    
+    @classmethod
+    def _ensure_stone_pixmaps(cls, ratio):
+        """Render the four stone images once and reuse them for every stone on the board"""
+        if cls._pixmaps is None or cls._pixmap_ratio != ratio:
+            cls._pixmaps = {}
+            for value in (GomokuEngine.PLAYER, GomokuEngine.AI):
+                for is_recent in (False, True):
+                    pixmap = QPixmap(round(cls.CELL_SIZE * ratio), round(cls.CELL_SIZE * ratio))
+                    pixmap.setDevicePixelRatio(ratio)
+                    pixmap.fill(Qt.transparent)
+                    painter = QPainter(pixmap)
+                    painter.setRenderHint(QPainter.Antialiasing)
+                    cls.draw_stone(painter, value, is_recent)
+                    painter.end()
+                    cls._pixmaps[(value, is_recent)] = pixmap
+            cls._pixmap_ratio = ratio
+        return cls._pixmaps
+    
+    @staticmethod
+    def draw_stone(painter, value, is_recent):
+        """Draw a stone, with its recent-move outline if requested, into a 40x40 area"""
+        if value == GomokuEngine.PLAYER:
             # Black stone with subtle gradient - smaller size
             gradient = QRadialGradient(15, 15, 15)  # Smaller gradient radius
             gradient.setColorAt(0, QColor(50, 50, 50))
@@ -211,12 +531,12 @@ class BoardCell(QPushButton):
             painter.drawEllipse(12, 12, 8, 8)  # Smaller highlight
             
             # Highlight if this is a recent move (red outline for black stones)
-            if self.is_recent_move:
+            if is_recent:
                 painter.setPen(QPen(QColor(255, 0, 0), 2))
                 painter.setBrush(Qt.NoBrush)
                 painter.drawEllipse(6, 6, 28, 28)  # Smaller outline
             
-        elif self.value == GomokuEngine.AI:
+        elif value == GomokuEngine.AI:
             # White stone with subtle gradient - smaller size
             gradient = QRadialGradient(15, 15, 15)  # Smaller gradient radius
             gradient.setColorAt(0, QColor(255, 255, 255))
@@ -231,66 +551,36 @@ class BoardCell(QPushButton):
             painter.drawEllipse(12, 12, 12, 8)  # Smaller highlight
             
             # Highlight if this is a recent move (blue outline for white stones)
-            if self.is_recent_move:
+            if is_recent:
                 painter.setPen(QPen(QColor(0, 0, 255), 2))
                 painter.setBrush(Qt.NoBrush)
                 painter.drawEllipse(6, 6, 28, 28)  # Smaller outline
 
 
-class GomokuBoard(QWidget):
-    """The Gomoku board widget"""
-    
-    # Signal to update the game timer
-    move_made = pyqtSignal()
-    
-    # Game modes
-    MODE_PLAYER_VS_AI = 0
-    MODE_PLAYER_VS_PLAYER = 1
-    MODE_AI_VS_AI = 2
+    def focusInEvent(self, event):
+        self.update(self.cell_rect(*self.current_focus))
+        super().focusInEvent(event)
     
-    def __init__(self, parent=None):
-        super().__init__(parent)
-        self.init_ui()
-        self.engine = GomokuEngine()
-        self.player_turn = True
-        self.game_in_progress = False
-        self.game_mode = self.MODE_PLAYER_VS_AI  # Default mode
-        
-        # Game statistics
-        self.games_played = 0
-        self.player_wins = 0
-        self.ai_wins = 0
-        self.draws = 0
-        
-        # Move history
-        self.move_history = []  # List of (row, col, player) tuples
-        self.current_move_index = -1  # Current position in replay
-        self.replay_mode = False  # Whether currently in replay mode
-        self.last_move_position = None  # (row, col) of the last move
-        
-        # For keyboard navigation
-        self.setFocusPolicy(Qt.StrongFocus)
-        self.current_focus = (7, 7)  # Center cell
+    def focusOutEvent(self, event):
+        self.update(self.cell_rect(*self.current_focus))
+        super().focusOutEvent(event)
     
-    def init_ui(self):
-        layout = QGridLayout()
-        layout.setSpacing(0)
-        
-        self.cells = []
-        for row in range(GomokuEngine.BOARD_SIZE):
-            row_cells = []
-            for col in range(GomokuEngine.BOARD_SIZE):
-                cell = BoardCell(row, col)
-                cell.clicked.connect(self.cell_clicked)
-                layout.addWidget(cell, row, col)
-                row_cells.append(cell)
-            self.cells.append(row_cells)
-        
-        self.setLayout(layout)
+    def set_focus_cell(self, row, col):
+        """Move the keyboard focus outline to a cell"""
+        self.update(self.cell_rect(*self.current_focus))
+        self.current_focus = (row, col)
+        self.update(self.cell_rect(row, col))
     
-
+    def mousePressEvent(self, event):
+        if event.button() != Qt.LeftButton:
+            return super().mousePressEvent(event)
+        cell = self.cell_at(event.pos())
+        if cell:
+            self.set_focus_cell(*cell)
+            self.cell_clicked(*cell)
             
     def reset_game(self):
+        self._ai_timer.stop()
         self.engine.reset_game()
         self.player_turn = True
         self.game_in_progress = True
@@ -299,25 +589,22 @@ class GomokuBoard(QWidget):
         self.current_move_index = -1
         self.last_move_position = None
         
-        # Reset the UI
-        for row in range(GomokuEngine.BOARD_SIZE):
-            for col in range(GomokuEngine.BOARD_SIZE):
-                self.cells[row][col].set_value(GomokuEngine.EMPTY)
+        # Reset the UI with a single repaint
+        self.clear_cells()
         
         # Set focus to center cell
-        self.current_focus = (GomokuEngine.BOARD_SIZE // 2, GomokuEngine.BOARD_SIZE // 2)
-        self.cells[self.current_focus[0]][self.current_focus[1]].setFocus()
+        self.set_focus_cell(BOARD_SIZE // 2, BOARD_SIZE // 2)
+        self.setFocus()
                 
         # Update status based on game mode
-        if hasattr(self.parent(), 'update_status'):
-            if self.game_mode == self.MODE_PLAYER_VS_AI:
-                self.parent().update_status("Your turn (Black)")
-            elif self.game_mode == self.MODE_PLAYER_VS_PLAYER:
-                self.parent().update_status("Black's turn")
-            elif self.game_mode == self.MODE_AI_VS_AI:
-                self.parent().update_status("AI vs AI Game - Black's turn")
-                # Start the AI vs AI game after a slight delay
-                QTimer.singleShot(500, self.ai_move)
+        if self.game_mode == self.MODE_PLAYER_VS_AI:
+            self._update_status("Your turn (Black)")
+        elif self.game_mode == self.MODE_PLAYER_VS_PLAYER:
+            self._update_status("Black's turn")
+        elif self.game_mode == self.MODE_AI_VS_AI:
+            self._update_status("AI vs AI Game - Black's turn")
+            # Start the AI vs AI game after a slight delay
+            self.schedule_ai_move()
         
         # Signal that a new game has started
         self.move_made.emit()
@@ -328,9 +615,9 @@ class GomokuBoard(QWidget):
             self.game_mode = mode
             self.reset_game()
     
-    def cell_clicked(self):
+    def cell_clicked(self, row, col):
         # Ignore clicks if in replay mode or game over
-        if self.replay_mode or self.engine.is_game_over():
+        if self.replay_mode or self._is_game_over():
             return
             
         # In Player vs AI mode, only handle clicks during player's turn
@@ -342,35 +629,31 @@ class GomokuBoard(QWidget):
         if self.game_mode == self.MODE_AI_VS_AI:
             return
         
-        # Get the clicked cell
-        cell = self.sender()
-        row, col = cell.row, cell.col
-        
-        # Check if the cell is empty
-        if self.engine.get_board_value(row, col) != GomokuEngine.EMPTY:
+        # Check if the cell is empty; the widget mirrors the engine's board outside replay mode
+        if self._stones[row * BOARD_SIZE + col] != GomokuEngine.EMPTY:
             return
         
         # Clear any previous "recent move" highlights
         if self.last_move_position:
             last_row, last_col = self.last_move_position
-            self.cells[last_row][last_col].set_recent(False)
+            self.set_recent(last_row, last_col, False)
         
         # Make the move
         current_player = GomokuEngine.PLAYER if self.player_turn else GomokuEngine.AI
-        if self.engine.make_move(row, col, current_player):
+        if self._make_move(row, col, current_player):
             # Record the move in history
             self.move_history.append((row, col, current_player))
             self.current_move_index = len(self.move_history) - 1
             self.last_move_position = (row, col)
             
             # Update the UI
-            cell.set_value(current_player, True)  # True = recent move
+            self.set_cell(row, col, current_player, True)  # True = recent move
             
             # Signal that a move was made
             self.move_made.emit()
             
             # Check if game over
-            if self.engine.is_game_over():
+            if self._is_game_over():
                 self.game_over()
                 return
             
@@ -380,46 +663,45 @@ class GomokuBoard(QWidget):
             # For Player vs AI mode, if it's AI's turn, make the AI move
             if self.game_mode == self.MODE_PLAYER_VS_AI and not self.player_turn:
                 # Update status
-                if hasattr(self.parent(), 'update_status'):
-                    self.parent().update_status("AI is thinking...")
+                self._update_status("AI is thinking...")
                 self.ai_move()
             # For Player vs Player mode, update the status appropriately
             elif self.game_mode == self.MODE_PLAYER_VS_PLAYER:
-                if hasattr(self.parent(), 'update_status'):
-                    next_player = "Black" if self.player_turn else "White"
-                    self.parent().update_status(f"{next_player}'s turn")
+                next_player = "Black" if self.player_turn else "White"
+                self._update_status(f"{next_player}'s turn")
             # For AI vs AI mode, this shouldn't be reached
     
+    def schedule_ai_move(self):
+        """Make the next AI move after a short delay, replacing any pending one"""
+        self._ai_timer.start()
+    
     def ai_move(self):
         # Don't make AI moves in replay mode or if game is over
-        if self.replay_mode or self.engine.is_game_over():
+        if self.replay_mode or self._is_game_over():
             return
         
         # Clear any previous "recent move" highlights
         if self.last_move_position:
             last_row, last_col = self.last_move_position
-            self.cells[last_row][last_col].set_recent(False)
-        
-        # Get AI's move
-        row, col = self.engine.get_best_move()
+            self.set_recent(last_row, last_col, False)
         
-        # Make AI's move
+        # Find and make AI's move
         current_player = GomokuEngine.PLAYER if self.player_turn else GomokuEngine.AI
-        if row >= 0 and col >= 0:
-            if self.engine.make_move(row, col, current_player):
-                # Record the move in history
-                self.move_history.append((row, col, current_player))
-                self.current_move_index = len(self.move_history) - 1
-                self.last_move_position = (row, col)
-                
-                # Update the UI
-                self.cells[row][col].set_value(current_player, True)  # True = recent move
-                
-                # Signal that a move was made
-                self.move_made.emit()
+        row, col, is_over = self._play_best(current_player)
+        if row >= 0:
+            # Record the move in history
+            self.move_history.append((row, col, current_player))
+            self.current_move_index = len(self.move_history) - 1
+            self.last_move_position = (row, col)
+            
+            # Update the UI
+            self.set_cell(row, col, current_player, True)  # True = recent move
+            
+            # Signal that a move was made
+            self.move_made.emit()
         
-        # Check if game over
-        if self.engine.is_game_over():
+        # Check if game over; the AI only finds no move when the board is full, which is a draw
+        if is_over or row < 0:
             self.game_over()
             return
         
@@ -428,15 +710,13 @@ class GomokuBoard(QWidget):
         
         # If in AI vs AI mode and it's still AI's turn, schedule another AI move
         if self.game_mode == self.MODE_AI_VS_AI:
-            if hasattr(self.parent(), 'update_status'):
-                next_player = "Black AI" if self.player_turn else "White AI"
-                self.parent().update_status(f"{next_player} is thinking...")
+            next_player = "Black AI" if self.player_turn else "White AI"
+            self._update_status(f"{next_player} is thinking...")
             # Schedule the next AI move after a short delay
-            QTimer.singleShot(500, self.ai_move)
+            self.schedule_ai_move()
         # If in Player vs AI mode and it's now player's turn
         elif self.game_mode == self.MODE_PLAYER_VS_AI and self.player_turn:
-            if hasattr(self.parent(), 'update_status'):
-                self.parent().update_status("Your turn (Black)")
+            self._update_status("Your turn (Black)")
     
     def game_over(self):
         winner = self.engine.get_winner()
@@ -486,13 +766,20 @@ class GomokuBoard(QWidget):
                 message = "It's a draw!"
                 self.draws += 1
         
-        # Update status if parent exists
-        if hasattr(self.parent(), 'update_status'):
-            self.parent().update_status(message)
+        # Update status
+        self._update_status(message)
         
         # Notify parent to update statistics display
-        if hasattr(self.parent(), 'update_statistics'):
-            self.parent().update_statistics(self.games_played, self.player_wins, self.ai_wins, self.draws)
+        self._update_statistics(self.games_played, self.player_wins, self.ai_wins, self.draws)
+        
+        # Ask from the next event-loop pass, so the winning stone is painted before the modal dialog
+        QTimer.singleShot(0, functools.partial(self.ask_play_again, message))
+    
+    def ask_play_again(self, message):
+        """Offer a new game after a game has ended"""
+        # A new game may already have been started in the meantime
+        if self.game_in_progress:
+            return
         
         reply = QMessageBox.question(self, 'Game Over', 
             f"{message} Do you want to play again?", 
@@ -523,12 +810,7 @@ class GomokuBoard(QWidget):
                             self.last_move_position = (last_row, last_col)
                             
                     # Update the UI to reflect the change
-                    for row in range(GomokuEngine.BOARD_SIZE):
-                        for col in range(GomokuEngine.BOARD_SIZE):
-                            value = self.engine.get_board_value(row, col)
-                            is_recent = (row, col) == self.last_move_position if self.last_move_position else False
-                            self.cells[row][col].set_value(value, is_recent)
-                            
+                    self.refresh_changed_cells(self.last_move_position)
                     return True
         # For Player vs Player mode, undo one move at a time
         elif self.game_mode == self.MODE_PLAYER_VS_PLAYER and self.game_in_progress:
@@ -546,16 +828,24 @@ class GomokuBoard(QWidget):
                             self.last_move_position = (last_row, last_col)
                     
                     # Update the UI
-                    for row in range(GomokuEngine.BOARD_SIZE):
-                        for col in range(GomokuEngine.BOARD_SIZE):
-                            value = self.engine.get_board_value(row, col)
-                            is_recent = (row, col) == self.last_move_position if self.last_move_position else False
-                            self.cells[row][col].set_value(value, is_recent)
-                            
+                    self.refresh_changed_cells(self.last_move_position)
                     return True
                     
         return False
     
+    def refresh_changed_cells(self, recent):
+        """Repaint only the cells whose stone differs from the engine's board,
+        and move the recent-move highlight to recent ((row, col) or None)"""
+        board = bytes(self.engine.get_board())
+        for index, (new, old) in enumerate(zip(board, self._stones)):
+            if new != old:
+                self.set_cell(*divmod(index, BOARD_SIZE), new)
+        
+        if recent:
+            self.set_recent(*recent, True)
+        elif self._recent:
+            self.set_recent(*self._recent, False)
+    
     def keyPressEvent(self, event):
         """Handle keyboard navigation"""
         if not self.game_in_progress or not self.player_turn:
@@ -566,18 +856,17 @@ class GomokuBoard(QWidget):
         # Arrow keys for navigation
         if event.key() == Qt.Key_Up and row > 0:
             row -= 1
-        elif event.key() == Qt.Key_Down and row < GomokuEngine.BOARD_SIZE - 1:
+        elif event.key() == Qt.Key_Down and row < BOARD_SIZE - 1:
             row += 1
         elif event.key() == Qt.Key_Left and col > 0:
             col -= 1
-        elif event.key() == Qt.Key_Right and col < GomokuEngine.BOARD_SIZE - 1:
+        elif event.key() == Qt.Key_Right and col < BOARD_SIZE - 1:
             col += 1
         # Enter or Space to make a move
         elif event.key() in (Qt.Key_Return, Qt.Key_Enter, Qt.Key_Space):
             # Simulate a click on the cell
-            if self.engine.get_board_value(row, col) == GomokuEngine.EMPTY:
-                cell = self.cells[row][col]
-                cell.click()
+            if self._stones[row * BOARD_SIZE + col] == GomokuEngine.EMPTY:
+                self.cell_clicked(row, col)
                 return
         # U to undo
         elif event.key() == Qt.Key_U:
@@ -587,30 +876,11 @@ class GomokuBoard(QWidget):
             return super().keyPressEvent(event)
             
         # Update focus
-        self.current_focus = (row, col)
-        self.cells[row][col].setFocus()
-        
-    def find_resource(self, filename, resource_dirs):
-        """Find a resource file in multiple possible directories"""
-        # First check all provided directories
-        for directory in resource_dirs:
-            filepath = os.path.join(directory, filename)
-            if os.path.exists(filepath):
-                return filepath
-                
-        # If the file was not found, return the path in the first directory
-        # (it will be created there if needed)
-        return os.path.join(resource_dirs[0], filename)
+        self.set_focus_cell(row, col)
         
     def get_board_state(self):
         """Get the current state of the board as a 2D array"""
-        board = []
-        for row in range(GomokuEngine.BOARD_SIZE):
-            board_row = []
-            for col in range(GomokuEngine.BOARD_SIZE):
-                board_row.append(self.engine.get_board_value(row, col))
-            board.append(board_row)
-        return board
+        return self.engine.get_board_view().tolist()
     
     def enter_replay_mode(self):
         """Enter replay mode to review game history"""
@@ -622,9 +892,8 @@ class GomokuBoard(QWidget):
         # Start from the beginning of the game
         self.reset_board_to_move(-1)  # -1 means empty board
         
-        if hasattr(self.parent(), 'update_status'):
-            self.parent().update_status("Replay Mode - Use Previous/Next to navigate moves")
-            
+        self._update_status("Replay Mode - Use Previous/Next to navigate moves")
+        
         return True
         
     def exit_replay_mode(self):
@@ -637,39 +906,33 @@ class GomokuBoard(QWidget):
         # Restore the game to the latest move
         self.reset_board_to_move(len(self.move_history) - 1)
         
-        if hasattr(self.parent(), 'update_status'):
-            if self.game_mode == self.MODE_PLAYER_VS_AI:
-                status = "Your turn (Black)" if self.player_turn else "AI's turn"
-            elif self.game_mode == self.MODE_PLAYER_VS_PLAYER:
-                status = "Black's turn" if self.player_turn else "White's turn"
-            else:  # AI_VS_AI
-                status = "AI vs AI Game"
-            self.parent().update_status(status)
-            
+        if self.game_mode == self.MODE_PLAYER_VS_AI:
+            status = "Your turn (Black)" if self.player_turn else "AI's turn"
+        elif self.game_mode == self.MODE_PLAYER_VS_PLAYER:
+            status = "Black's turn" if self.player_turn else "White's turn"
+        else:  # AI_VS_AI
+            status = "AI vs AI Game"
+        self._update_status(status)
+        
     def reset_board_to_move(self, move_index):
         """Reset the board to show the state after the specified move"""
         # Clear the board
         self.engine.reset_game()
-        for row in range(GomokuEngine.BOARD_SIZE):
-            for col in range(GomokuEngine.BOARD_SIZE):
-                self.cells[row][col].set_value(GomokuEngine.EMPTY)
         
-        # If move_index is -1, we want an empty board
-        if move_index < 0:
-            self.current_move_index = -1
-            return
-            
-        # Apply moves up to the specified index
-        for i in range(min(move_index + 1, len(self.move_history))):
-            row, col, player = self.move_history[i]
-            self.engine.make_move(row, col, player)
-            
-            # Only highlight the latest move
-            is_latest = (i == move_index)
-            self.cells[row][col].set_value(player, is_latest)
+        # Apply moves up to the specified index (-1 means an empty board)
+        moves = self.move_history[:max(move_index + 1, 0)]
+        self.engine.apply_moves(moves)
+        
+        # Only highlight the latest move
+        latest = None
+        if moves and len(moves) == move_index + 1:
+            latest = tuple(moves[-1][:2])
+        
+        # Repaint only the cells that changed and highlight the latest move once
+        self.refresh_changed_cells(latest)
                 
         # Update the current move index
-        self.current_move_index = move_index
+        self.current_move_index = max(move_index, -1)
         
     def next_move(self):
         """Show the next move in replay mode"""
@@ -686,19 +949,18 @@ class GomokuBoard(QWidget):
             # Clear previous highlight
             if self.last_move_position:
                 last_row, last_col = self.last_move_position
-                self.cells[last_row][last_col].set_recent(False)
+                self.set_recent(last_row, last_col, False)
             
             # Set the new move and highlight it
             self.engine.make_move(row, col, player)
-            self.cells[row][col].set_value(player, True)
+            self.set_cell(row, col, player, True)
             self.last_move_position = (row, col)
             
             # Update status
-            if hasattr(self.parent(), 'update_status'):
-                move_num = self.current_move_index + 1
-                player_str = "Black" if player == GomokuEngine.PLAYER else "White"
-                self.parent().update_status(f"Replay: Move {move_num}/{len(self.move_history)} - {player_str}")
-                
+            move_num = self.current_move_index + 1
+            player_str = "Black" if player == GomokuEngine.PLAYER else "White"
+            self._update_status(f"Replay: Move {move_num}/{len(self.move_history)} - {player_str}")
+            
             return True
             
         return False
@@ -711,7 +973,7 @@ class GomokuBoard(QWidget):
         # Clear the current highlight
         if self.current_move_index < len(self.move_history):
             row, col, _ = self.move_history[self.current_move_index]
-            self.cells[row][col].set_recent(False)
+            self.set_recent(row, col, False)
         
         # Move to the previous move
         self.current_move_index -= 1
@@ -720,39 +982,161 @@ class GomokuBoard(QWidget):
         self.reset_board_to_move(self.current_move_index)
         
         # Update status
-        if hasattr(self.parent(), 'update_status'):
-            if self.current_move_index >= 0:
-                move_num = self.current_move_index + 1
-                row, col, player = self.move_history[self.current_move_index]
-                player_str = "Black" if player == GomokuEngine.PLAYER else "White"
-                self.parent().update_status(f"Replay: Move {move_num}/{len(self.move_history)} - {player_str}")
-            else:
-                self.parent().update_status("Replay: Initial board")
-                
+        if self.current_move_index >= 0:
+            move_num = self.current_move_index + 1
+            row, col, player = self.move_history[self.current_move_index]
+            player_str = "Black" if player == GomokuEngine.PLAYER else "White"
+            self._update_status(f"Replay: Move {move_num}/{len(self.move_history)} - {player_str}")
+        else:
+            self._update_status("Replay: Initial board")
+            
         return True
         
 
+# Style sheets, built once per process and shared by every window
+_MAIN_QSS = """
+    QMainWindow { 
+        background-color: #2C3E50; 
+        color: #ECF0F1;
+    }
+    QWidget { 
+        background-color: #2C3E50; 
+        color: #ECF0F1;
+    }
+    QGroupBox { 
+        font-weight: bold; 
+        border: 1px solid #34495E; 
+        border-radius: 5px; 
+        margin-top: 10px; 
+        background-color: #34495E;
+        color: #ECF0F1;
+    }
+    QGroupBox::title { 
+        subcontrol-origin: margin; 
+        left: 10px; 
+        padding: 0 5px 0 5px; 
+        color: #3498DB;
+    }
+    QLabel { 
+        padding: 5px; 
+        color: #ECF0F1;
+    }
+    QComboBox { 
+        padding: 5px; 
+        background-color: #34495E; 
+        color: #ECF0F1;
+        border: 1px solid #3498DB;
+        border-radius: 3px;
+    }
+    QComboBox:hover {
+        border: 1px solid #2980B9;
+    }
+    QComboBox QAbstractItemView {
+        background-color: #34495E;
+        color: #ECF0F1;
+        selection-background-color: #3498DB;
+    }
+    QPushButton {
+        color: white;
+        border-radius: 3px;
+        padding: 8px;
+        font-weight: bold;
+    }
+    QPushButton#resetBtn, QPushButton#undoBtn {
+        border-radius: 5px;
+    }
+    QPushButton#resetBtn {
+        background-color: #4CAF50;
+    }
+    QPushButton#resetBtn:hover {
+        background-color: #45a049;
+    }
+    QPushButton#undoBtn {
+        background-color: #2196F3;
+    }
+    QPushButton#undoBtn:hover {
+        background-color: #0b7dda;
+    }
+    QLabel#statusLabel {
+        font-size: 14px;
+        font-weight: bold;
+    }
+    QLabel#timerLabel {
+        font-size: 14px;
+    }
+    QLabel#replayFlag {
+        color: #FF5733;
+        font-weight: bold;
+        background-color: #34495E;
+        padding: 5px;
+        border-radius: 3px;
+    }
+    QLabel#replayFlag[replayOn="true"] {
+        color: #4CAF50;
+    }
+    QLabel#aboutTitle {
+        font-size: 18px;
+        font-weight: bold;
+    }
+    QCheckBox {
+        color: #ECF0F1;
+    }
+    QMenuBar {
+        background-color: #34495E;
+        color: #ECF0F1;
+    }
+    QMenuBar::item {
+        background-color: #34495E;
+        color: #ECF0F1;
+    }
+    QMenuBar::item:selected {
+        background-color: #3498DB;
+    }
+    QMenu {
+        background-color: #34495E;
+        color: #ECF0F1;
+        border: 1px solid #2C3E50;
+    }
+    QMenu::item:selected {
+        background-color: #3498DB;
+    }
+"""
+
+
 class GomokuWindow(QMainWindow):
     """Main window for the Gomoku game"""
     
     def __init__(self):
         super().__init__()
+        # Coalesce bursts of settings changes into a single write
+        self._save_timer = QTimer(self)
+        self._save_timer.setSingleShot(True)
+        self._save_timer.timeout.connect(self._do_save_settings)
+        # Settings as last read from or written to disk, and the file holding them
+        self._saved_settings = None
+        self._settings_path = None
+        # About dialog, created the first time it is shown
+        self._about_dialog = None
+        
         self.init_ui()
         self.init_menu()
+        # Replay shortcuts handled by keyPressEvent
+        self._key_dispatch = {
+            Qt.Key_R: self._kb_toggle_replay,
+            Qt.Key_Left: self._kb_previous_move,
+            Qt.Key_Right: self._kb_next_move,
+        }
         self.init_timer()
         self.load_settings()
         self.setup_icon()
         
         # Display version info in the status bar
-        version = "1.0.0"  # Update this with the correct version number
-        platform_name = platform.system()
-        python_version = platform.python_version()
-        self.statusBar().showMessage(f"Ready | Five in a Row v{version} | {platform_name} | Python {python_version}")
+        self.statusBar().showMessage(_status_message("1.0.0"))  # Update this with the correct version number
         
         self.show()
         
-        # Validate that everything is loaded correctly
-        self._validate_environment()
+        # Validate that everything is loaded correctly once the first frame is up
+        QTimer.singleShot(0, self._validate_environment)
         
     def _validate_environment(self):
         """Validate that all required components are available"""
@@ -762,25 +1146,13 @@ class GomokuWindow(QMainWindow):
         if not hasattr(self.board, 'engine') or not hasattr(self.board.engine, 'lib'):
             issues.append("Failed to load the C++ backend library")
         
-        # Check for required resources
-        resource_files = ['gomoku_icon.png']
+        # Check for required resources; skip the icon while it is still being generated
+        resource_files = ['gomoku_icon.png'] if self._icon_task is None else []
         missing_resources = []
         
         # Check multiple resource directories
-        project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
-        possible_resource_dirs = [
-            os.path.join(project_root, 'resources'),
-            os.path.join(project_root, 'src', 'resources'),
-            os.path.join(project_root, '..', 'resources')
-        ]
-        
         for resource in resource_files:
-            found = False
-            for dir_path in possible_resource_dirs:
-                if os.path.exists(os.path.join(dir_path, resource)):
-                    found = True
-                    break
-            if not found:
+            if not _find_resource(resource):
                 missing_resources.append(resource)
         
         if missing_resources:
@@ -812,12 +1184,13 @@ class GomokuWindow(QMainWindow):
         # Game status
         status_box = QHBoxLayout()
         self.status_label = QLabel("Ready to play")
-        self.status_label.setStyleSheet("font-size: 14px; font-weight: bold;")
+        self.status_label.setObjectName("statusLabel")
         status_box.addWidget(self.status_label)
         
         # Game timer
         self.timer_label = QLabel("Time: 00:00")
-        self.timer_label.setStyleSheet("font-size: 14px;")
+        self.timer_label.setObjectName("timerLabel")
+        self._last_displayed_sec = 0
         status_box.addWidget(self.timer_label)
         
         header_layout.addLayout(status_box)
@@ -828,35 +1201,13 @@ class GomokuWindow(QMainWindow):
         # New Game button
         self.reset_btn = QPushButton("New Game")
         self.reset_btn.clicked.connect(self.reset_game)
-        self.reset_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #4CAF50;
-                color: white;
-                font-weight: bold;
-                border-radius: 5px;
-                padding: 8px;
-            }
-            QPushButton:hover {
-                background-color: #45a049;
-            }
-        """)
+        self.reset_btn.setObjectName("resetBtn")
         controls_box.addWidget(self.reset_btn)
         
         # Undo button
         self.undo_btn = QPushButton("Undo")
         self.undo_btn.clicked.connect(self.undo_move)
-        self.undo_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #2196F3;
-                color: white;
-                font-weight: bold;
-                border-radius: 5px;
-                padding: 8px;
-            }
-            QPushButton:hover {
-                background-color: #0b7dda;
-            }
-        """)
+        self.undo_btn.setObjectName("undoBtn")
         self.undo_btn.setEnabled(False)  # Initially disabled
         controls_box.addWidget(self.undo_btn)
         
@@ -913,7 +1264,8 @@ class GomokuWindow(QMainWindow):
         
         # Flag indicator for replay mode
         self.replay_flag = QLabel("OFF")
-        self.replay_flag.setStyleSheet("color: #FF5733; font-weight: bold; background-color: #34495E; padding: 5px; border-radius: 3px;")
+        self.replay_flag.setObjectName("replayFlag")
+        self.replay_flag.setProperty("replayOn", False)
         self.replay_flag.setAlignment(Qt.AlignCenter)
         self.replay_flag.setFixedWidth(40)
         replay_buttons_layout.addWidget(self.replay_flag)
@@ -938,6 +1290,7 @@ class GomokuWindow(QMainWindow):
         # Move counter label
         self.move_counter_label = QLabel("Move: 0/0")
         self.move_counter_label.setAlignment(Qt.AlignCenter)
+        self._move_counter = (0, 0)
         replay_layout.addWidget(self.move_counter_label)
         
         replay_group.setLayout(replay_layout)
@@ -949,6 +1302,30 @@ class GomokuWindow(QMainWindow):
         self.ai_wins = 0
         self.draws = 0
         
+        # The help section is static text; it is added once the window is up
+        self._right_panel = right_panel
+        QTimer.singleShot(0, self._build_help_panel)
+        
+        # Add spacing at the bottom of the right panel
+        right_panel.addStretch(1)
+        
+        main_layout.addLayout(right_panel, 3)  # Controls take 30% of width
+        
+        # Set window properties with an elegant color scheme
+        self.setStyleSheet(_MAIN_QSS)
+        
+        # Digits share one advance width, so a fixed width keeps ticks from relaying out the header
+        self.timer_label.ensurePolished()
+        self.timer_label.setFixedWidth(self.timer_label.sizeHint().width() + 8)
+        
+        self.setMinimumSize(800, 650)
+        self.setGeometry(100, 100, 800, 650)
+        
+        # Initialize with medium difficulty
+        self.change_difficulty(1)
+    
+    def _build_help_panel(self):
+        """Add the help section to the right panel"""
         # Help section
         help_group = QGroupBox("Game Help")
         help_layout = QVBoxLayout()
@@ -977,90 +1354,8 @@ class GomokuWindow(QMainWindow):
         help_layout.addWidget(shortcuts_label)
         
         help_group.setLayout(help_layout)
-        right_panel.addWidget(help_group)
-        
-        # Add spacing at the bottom of the right panel
-        right_panel.addStretch(1)
-        
-        main_layout.addLayout(right_panel, 3)  # Controls take 30% of width
-        
-        # Set window properties with an elegant color scheme
-        self.setStyleSheet("""
-            QMainWindow { 
-                background-color: #2C3E50; 
-                color: #ECF0F1;
-            }
-            QWidget { 
-                background-color: #2C3E50; 
-                color: #ECF0F1;
-            }
-            QGroupBox { 
-                font-weight: bold; 
-                border: 1px solid #34495E; 
-                border-radius: 5px; 
-                margin-top: 10px; 
-                background-color: #34495E;
-                color: #ECF0F1;
-            }
-            QGroupBox::title { 
-                subcontrol-origin: margin; 
-                left: 10px; 
-                padding: 0 5px 0 5px; 
-                color: #3498DB;
-            }
-            QLabel { 
-                padding: 5px; 
-                color: #ECF0F1;
-            }
-            QComboBox { 
-                padding: 5px; 
-                background-color: #34495E; 
-                color: #ECF0F1;
-                border: 1px solid #3498DB;
-                border-radius: 3px;
-            }
-            QComboBox:hover {
-                border: 1px solid #2980B9;
-            }
-            QComboBox QAbstractItemView {
-                background-color: #34495E;
-                color: #ECF0F1;
-                selection-background-color: #3498DB;
-            }
-            QPushButton {
-                color: white;
-                border-radius: 3px;
-                padding: 8px;
-                font-weight: bold;
-            }
-            QCheckBox {
-                color: #ECF0F1;
-            }
-            QMenuBar {
-                background-color: #34495E;
-                color: #ECF0F1;
-            }
-            QMenuBar::item {
-                background-color: #34495E;
-                color: #ECF0F1;
-            }
-            QMenuBar::item:selected {
-                background-color: #3498DB;
-            }
-            QMenu {
-                background-color: #34495E;
-                color: #ECF0F1;
-                border: 1px solid #2C3E50;
-            }
-            QMenu::item:selected {
-                background-color: #3498DB;
-            }
-        """)
-        self.setMinimumSize(800, 650)
-        self.setGeometry(100, 100, 800, 650)
-        
-        # Initialize with medium difficulty
-        self.change_difficulty(1)
+        # Keep it above the stretch at the bottom of the panel
+        self._right_panel.insertWidget(self._right_panel.count() - 1, help_group)
     
     def init_menu(self):
         """Initialize the menu bar"""
@@ -1108,71 +1403,109 @@ class GomokuWindow(QMainWindow):
     
     def init_timer(self):
         """Initialize the game timer"""
+        # The clock measures the time itself; the coarse tick only refreshes the label
         self.game_timer = QTimer()
+        self.game_timer.setTimerType(Qt.VeryCoarseTimer)
         self.game_timer.timeout.connect(self.update_timer)
-        self.game_time_seconds = 0
+        self._game_clock = QElapsedTimer()
+        self._game_time_base_ms = 0  # Time accumulated while the clock was not running
+    
+    @property
+    def game_time_seconds(self):
+        """Seconds played in the current game"""
+        elapsed_ms = self._game_time_base_ms
+        if self._game_clock.isValid():
+            elapsed_ms += self._game_clock.elapsed()
+        return elapsed_ms // 1000
+    
+    @game_time_seconds.setter
+    def game_time_seconds(self, seconds):
+        self._game_time_base_ms = seconds * 1000
+        if self._game_clock.isValid():
+            self._game_clock.restart()
+    
+    def start_game_clock(self):
+        """Start counting game time and refreshing the timer label"""
+        if not self._game_clock.isValid():
+            self._game_clock.start()
+            # While hidden or minimized the label isn't ticked; showEvent resumes it
+            if self.isVisible():
+                self.game_timer.start(1000)  # Update every second
+    
+    def stop_game_clock(self):
+        """Stop counting game time, keeping the time played so far"""
+        if self._game_clock.isValid():
+            self._game_time_base_ms += self._game_clock.elapsed()
+            self._game_clock.invalidate()
+            self.game_timer.stop()
+    
+    def showEvent(self, event):
+        """Catch the timer label up and resume ticking it if a game is being timed"""
+        super().showEvent(event)
+        if self._game_clock.isValid() and not self.game_timer.isActive():
+            self.update_timer()
+            self.game_timer.start(1000)
+    
+    def hideEvent(self, event):
+        """Stop ticking the timer label while the window is hidden; the clock keeps counting"""
+        super().hideEvent(event)
+        self.game_timer.stop()
     
     def setup_icon(self):
         """Set up the application icon"""
-        # Get project root directory and possible resource directories
-        project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
-        
-        # Check multiple possible resource directories
-        possible_resource_dirs = [
-            os.path.join(project_root, 'resources'),
-            os.path.join(project_root, 'src', 'resources'),
-            os.path.join(project_root, '..', 'resources')
-        ]
+        self._icon_task = None
         
         # Try to find the icon in any of the resource directories
-        icon_path = None
-        for resource_dir in possible_resource_dirs:
-            path = os.path.join(resource_dir, 'gomoku_icon.png')
-            if os.path.exists(path):
-                icon_path = path
-                break
+        icon_path = _find_resource('gomoku_icon.png')
         
         # If icon not found, generate it
         if not icon_path:
             # Use the first directory for creating the icon
-            resources_dir = possible_resource_dirs[0]
+            resources_dir = _RESOURCE_DIRS[0]
             if not os.path.exists(resources_dir):
                 os.makedirs(resources_dir)
             
             icon_path = os.path.join(resources_dir, 'gomoku_icon.png')
             
-            try:
-                # Import the create_icon module
-                import sys
-                sys.path.append(os.path.dirname(os.path.abspath(__file__)))
-                import create_icon
-                
-                # Create the icon
-                create_icon.create_gomoku_icon(512, icon_path)
-                print(f"Generated icon at: {icon_path}")
-            except ImportError as e:
-                print(f"Error importing create_icon module: {e}")
-                pass
+            # The create_icon module lives next to this file; add it to sys.path only once
+            if _FRONTEND_DIR not in sys.path:
+                sys.path.append(_FRONTEND_DIR)
+            
+            # Draw the icon off the GUI thread; the window shows without one until it's ready
+            self._icon_task = _IconGenTask(icon_path)
+            self._icon_task.finished.connect(self._on_icon_generated)
+            QThreadPool.globalInstance().start(self._icon_task)
+            return
         
-        # Set the icon if found or created
+        self.setWindowIcon(_IconCache.get(icon_path))
+        print(f"Using icon from: {icon_path}")
+    
+    def _on_icon_generated(self, icon_path):
+        """Set the window icon once the background task has written it"""
+        self._icon_task = None
         if icon_path and os.path.exists(icon_path):
-            self.setWindowIcon(QIcon(icon_path))
+            _dir_entries.cache_clear()
+            _find_resource.cache_clear()
+            print(f"Generated icon at: {icon_path}")
+            self.setWindowIcon(_IconCache.get(icon_path))
             print(f"Using icon from: {icon_path}")
         else:
             print("Warning: No icon found or generated")
-        
+    
     def update_timer(self):
         """Update the game timer display"""
-        self.game_time_seconds += 1
-        minutes = self.game_time_seconds // 60
-        seconds = self.game_time_seconds % 60
+        elapsed = self.game_time_seconds
+        if elapsed == self._last_displayed_sec:
+            return
+        self._last_displayed_sec = elapsed
+        minutes, seconds = divmod(elapsed, 60)
         self.timer_label.setText(f"Time: {minutes:02d}:{seconds:02d}")
     
     def on_move_made(self):
         """Handle when a move is made in the game"""
         # Start timer if it's not running
-        if not self.game_timer.isActive() and self.board.game_in_progress:
-            self.game_timer.start(1000)  # Update every second
+        if self.board.game_in_progress:
+            self.start_game_clock()
         
         # Enable/disable undo button based on whether undo is possible
         self.undo_btn.setEnabled(self.board.engine.can_undo())
@@ -1182,14 +1515,19 @@ class GomokuWindow(QMainWindow):
             self.replay_toggle_btn.setEnabled(True)
             
         # Update move counter label
-        if self.board.move_history:
-            self.move_counter_label.setText(f"Move: {len(self.board.move_history)}/{len(self.board.move_history)}")
-        else:
-            self.move_counter_label.setText("Move: 0/0")
+        total_moves = len(self.board.move_history)
+        self.set_move_counter(total_moves, total_moves)
         
         # If game is over, stop the timer
         if not self.board.game_in_progress:
-            self.game_timer.stop()
+            self.stop_game_clock()
+    
+    def set_move_counter(self, current_move, total_moves):
+        """Show "Move: current/total", skipping the label update when nothing changed"""
+        counter = (current_move, total_moves)
+        if counter != self._move_counter:
+            self._move_counter = counter
+            self.move_counter_label.setText(f"Move: {current_move}/{total_moves}")
     
     def reset_game(self):
         """Start a new game"""
@@ -1201,18 +1539,19 @@ class GomokuWindow(QMainWindow):
         # Reset replay controls
         self.replay_toggle_btn.setEnabled(False)  # No moves to replay yet
         self.replay_toggle_btn.setChecked(False)
-        self.replay_flag.setText("OFF")
-        self.replay_flag.setStyleSheet("color: #FF5733; font-weight: bold; background-color: #34495E; padding: 5px; border-radius: 3px;")
+        self.set_replay_flag(False)
         self.replay_prev_btn.setEnabled(False)
         self.replay_next_btn.setEnabled(False)
-        self.move_counter_label.setText("Move: 0/0")
+        self.set_move_counter(0, 0)
         
         # Set AI difficulty widgets enabled state based on game mode
         self.difficulty_selector.setEnabled(self.board.game_mode != self.board.MODE_PLAYER_VS_PLAYER)
     
     def update_status(self, message):
         """Update the status message"""
-        self.status_label.setText(message)
+        # Skip the relayout when the message has not changed
+        if message != self.status_label.text():
+            self.status_label.setText(message)
     
     def update_statistics(self, games, player_wins, ai_wins, draws):
         """Store game statistics but don't display them (UI panel was removed)"""
@@ -1302,37 +1641,46 @@ class GomokuWindow(QMainWindow):
         # Save settings
         self.save_settings()
     
+    def set_replay_flag(self, on):
+        """Show the replay indicator as ON or OFF; its colours come from the replayOn rule in _MAIN_QSS"""
+        if self.replay_flag.property("replayOn") == on:
+            return
+        self.replay_flag.setText("ON" if on else "OFF")
+        self.replay_flag.setProperty("replayOn", on)
+        # Re-match the style sheet rules against the new property value
+        self.replay_flag.style().unpolish(self.replay_flag)
+        self.replay_flag.style().polish(self.replay_flag)
+    
     def toggle_replay(self):
         """Toggle replay mode on/off"""
         if self.replay_toggle_btn.isChecked():
             # Entering replay mode
-            if not self.board.move_history:
+            total_moves = len(self.board.move_history)
+            if not total_moves:
                 QMessageBox.information(self, "Replay", "No moves to replay yet.")
                 self.replay_toggle_btn.setChecked(False)
                 return
                 
             if self.board.enter_replay_mode():
                 # Update flag indicator
-                self.replay_flag.setText("ON")
-                self.replay_flag.setStyleSheet("color: #4CAF50; font-weight: bold; background-color: #34495E; padding: 5px; border-radius: 3px;")
+                self.set_replay_flag(True)
                 
                 # Start from the last move instead of the beginning
-                self.board.reset_board_to_move(len(self.board.move_history) - 1)
+                self.board.reset_board_to_move(total_moves - 1)
                 
                 # Enable previous button (since we start at the end)
                 self.replay_prev_btn.setEnabled(True)
                 self.replay_next_btn.setEnabled(False)  # No next move at the end
                 
                 # Update move counter
-                current_move = len(self.board.move_history)
-                total_moves = len(self.board.move_history)
-                self.move_counter_label.setText(f"Move: {current_move}/{total_moves}")
+                self.set_move_counter(total_moves, total_moves)
                 
                 # Update status
-                if self.board.current_move_index >= 0 and len(self.board.move_history) > 0:
-                    row, col, player = self.board.move_history[self.board.current_move_index]
+                move_index = self.board.current_move_index
+                if move_index >= 0:
+                    row, col, player = self.board.move_history[move_index]
                     player_str = "Black" if player == GomokuEngine.PLAYER else "White"
-                    self.update_status(f"Replay: Move {current_move}/{total_moves} - {player_str}")
+                    self.update_status(f"Replay: Move {total_moves}/{total_moves} - {player_str}")
                 
                 # Disable other game controls
                 self.reset_btn.setEnabled(False)
@@ -1347,8 +1695,7 @@ class GomokuWindow(QMainWindow):
             self.board.exit_replay_mode()
             
             # Update flag indicator
-            self.replay_flag.setText("OFF")
-            self.replay_flag.setStyleSheet("color: #FF5733; font-weight: bold; background-color: #34495E; padding: 5px; border-radius: 3px;")
+            self.set_replay_flag(False)
             
             # Disable navigation buttons
             self.replay_prev_btn.setEnabled(False)
@@ -1364,43 +1711,55 @@ class GomokuWindow(QMainWindow):
         """Show the next move in the replay"""
         if self.board.next_move():
             # Update button states
+            current_move = self.board.current_move_index + 1
+            total_moves = len(self.board.move_history)
             self.replay_prev_btn.setEnabled(True)
-            if self.board.current_move_index >= len(self.board.move_history) - 1:
+            if current_move >= total_moves:
                 self.replay_next_btn.setEnabled(False)
             
             # Update move counter
-            current_move = self.board.current_move_index + 1
-            total_moves = len(self.board.move_history)
-            self.move_counter_label.setText(f"Move: {current_move}/{total_moves}")
+            self.set_move_counter(current_move, total_moves)
     
     def previous_move(self):
         """Show the previous move in the replay"""
         if self.board.previous_move():
             # Update button states
+            move_index = self.board.current_move_index
             self.replay_next_btn.setEnabled(True)
-            if self.board.current_move_index < 0:
+            if move_index < 0:
                 self.replay_prev_btn.setEnabled(False)
             
             # Update move counter
-            current_move = max(0, self.board.current_move_index + 1)
-            total_moves = len(self.board.move_history)
-            self.move_counter_label.setText(f"Move: {current_move}/{total_moves}")
+            self.set_move_counter(max(0, move_index + 1), len(self.board.move_history))
     
     def keyPressEvent(self, event):
         """Handle keyboard shortcuts for replay controls"""
-        # R to toggle replay mode
-        if event.key() == Qt.Key_R and self.replay_toggle_btn.isEnabled():
-            self.replay_toggle_btn.setChecked(not self.replay_toggle_btn.isChecked())
-            self.toggle_replay()
-        # Left arrow to go to previous move in replay
-        elif event.key() == Qt.Key_Left and self.board.replay_mode and self.replay_prev_btn.isEnabled():
-            self.previous_move()
-        # Right arrow to go to next move in replay
-        elif event.key() == Qt.Key_Right and self.board.replay_mode and self.replay_next_btn.isEnabled():
-            self.next_move()
-        else:
+        handler = self._key_dispatch.get(event.key())
+        if handler is None or not handler():
             super().keyPressEvent(event)
     
+    def _kb_toggle_replay(self):
+        """R toggles replay mode; returns whether the key was handled"""
+        if not self.replay_toggle_btn.isEnabled():
+            return False
+        self.replay_toggle_btn.setChecked(not self.replay_toggle_btn.isChecked())
+        self.toggle_replay()
+        return True
+    
+    def _kb_previous_move(self):
+        """Left arrow goes to the previous move in replay; returns whether the key was handled"""
+        if not (self.board.replay_mode and self.replay_prev_btn.isEnabled()):
+            return False
+        self.previous_move()
+        return True
+    
+    def _kb_next_move(self):
+        """Right arrow goes to the next move in replay; returns whether the key was handled"""
+        if not (self.board.replay_mode and self.replay_next_btn.isEnabled()):
+            return False
+        self.next_move()
+        return True
+    
     def save_game(self):
         """Save the current game to a file"""
         if not self.board.game_in_progress:
@@ -1429,8 +1788,10 @@ class GomokuWindow(QMainWindow):
         }
         
         try:
-            with open(file_path, 'w') as f:
-                json.dump(game_data, f)
+            # Encode in one go and write once rather than streaming small chunks
+            encoded = _json_dumps(game_data)
+            with open(file_path, 'wb') as f:
+                f.write(encoded)
             QMessageBox.information(self, "Save Game", "Game saved successfully!")
         except Exception as e:
             QMessageBox.critical(self, "Error", f"Failed to save the game: {str(e)}")
@@ -1442,8 +1803,9 @@ class GomokuWindow(QMainWindow):
             return
             
         try:
-            with open(file_path, 'r') as f:
-                game_data = json.load(f)
+            with open(file_path, 'rb') as f:
+                encoded = f.read()
+            game_data = _json_loads(encoded)
                 
             # Reset the game first
             self.board.reset_game()
@@ -1465,39 +1827,33 @@ class GomokuWindow(QMainWindow):
             if "board" in game_data:
                 board = game_data["board"]
                 
-                # Apply moves to the board
-                player_stones = 0
-                ai_stones = 0
-                last_row = last_col = -1
-                
-                for row in range(len(board)):
-                    for col in range(len(board[row])):
-                        if board[row][col] == GomokuEngine.PLAYER:
-                            self.board.engine.make_move(row, col, GomokuEngine.PLAYER)
-                            self.board.cells[row][col].set_value(GomokuEngine.PLAYER)
-                            last_row, last_col = row, col
-                            player_stones += 1
-                        elif board[row][col] == GomokuEngine.AI:
-                            self.board.engine.make_move(row, col, GomokuEngine.AI)
-                            self.board.cells[row][col].set_value(GomokuEngine.AI)
-                            last_row, last_col = row, col
-                            ai_stones += 1
+                # Replay the saved history when it matches the board: it holds every stone
+                # in the order it was played, so the empty cells never need visiting
+                history = self.board.move_history
+                # Flattened to bytes so counting runs in C rather than per cell in Python
+                stones = bytes(chain.from_iterable(board))
+                if (history and len(history) == len(stones) - stones.count(GomokuEngine.EMPTY)
+                        and all(stones[row * BOARD_SIZE + col] == player for row, col, player in history)):
+                    moves = [tuple(move) for move in history]
+                else:
+                    # Otherwise take the stones from the board; we don't know the exact order,
+                    # but this is a plausible history
+                    moves = [(*divmod(index, BOARD_SIZE), value)
+                             for index, value in enumerate(stones)
+                             if value != GomokuEngine.EMPTY]
+                    if not history:
+                        self.board.move_history = list(moves)
                 
-                # Highlight the last move
-                if last_row >= 0 and last_col >= 0:
-                    self.board.cells[last_row][last_col].set_recent(True)
-                    self.board.last_move_position = (last_row, last_col)
+                # Apply moves to the board
+                self.board.engine.apply_moves(moves)
+                player_stones = stones.count(GomokuEngine.PLAYER)
+                ai_stones = stones.count(GomokuEngine.AI)
                 
-                # If no move history was provided, reconstruct it from the board
-                if not self.board.move_history:
-                    self.board.move_history = []
-                    # We don't know the exact order, but we can reconstruct a plausible history
-                    for row in range(len(board)):
-                        for col in range(len(board[row])):
-                            if board[row][col] != GomokuEngine.EMPTY:
-                                self.board.move_history.append(
-                                    (row, col, board[row][col])
-                                )
+                # Show every stone in one repaint, highlighting the last move
+                last_move = tuple(moves[-1][:2]) if moves else None
+                self.board.load_cells(last_move)
+                if last_move:
+                    self.board.last_move_position = last_move
                 
                 self.board.current_move_index = len(self.board.move_history) - 1
             
@@ -1515,7 +1871,7 @@ class GomokuWindow(QMainWindow):
             
             # Start timer if the game is in progress
             self.board.game_in_progress = True
-            self.game_timer.start(1000)
+            self.start_game_clock()
             
             # Update status based on game mode
             if self.board.game_mode == self.board.MODE_PLAYER_VS_AI:
@@ -1530,7 +1886,7 @@ class GomokuWindow(QMainWindow):
                 self.update_status("AI vs AI Game")
                 # Start AI vs AI game if it was in progress
                 if not self.board.player_turn and not self.board.engine.is_game_over():
-                    QTimer.singleShot(500, self.board.ai_move)
+                    self.board.schedule_ai_move()
                 
             # Enable undo if possible
             self.undo_btn.setEnabled(self.board.engine.can_undo())
@@ -1541,6 +1897,17 @@ class GomokuWindow(QMainWindow):
             QMessageBox.critical(self, "Error", f"Failed to load the game: {str(e)}")
     
     def save_settings(self):
+        """Schedule a save of user preferences"""
+        self._save_timer.start(500)
+    
+    def closeEvent(self, event):
+        """Flush any pending settings save before closing"""
+        if self._save_timer.isActive():
+            self._save_timer.stop()
+            self._do_save_settings()
+        super().closeEvent(event)
+    
+    def _do_save_settings(self):
         """Save user preferences"""
         settings = {
             "difficulty": self.difficulty_selector.currentIndex(),
@@ -1553,57 +1920,61 @@ class GomokuWindow(QMainWindow):
             }
         }
         
-        # Get project root directory
-        project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
-        
-        # Check multiple possible resource directories
-        possible_resource_dirs = [
-            os.path.join(project_root, 'resources'),
-            os.path.join(project_root, 'src', 'resources'),
-            os.path.join(project_root, '..', 'resources')
-        ]
-        
-        # Use the first resource directory that exists, or create one
-        settings_dir = next((d for d in possible_resource_dirs if os.path.exists(d)), possible_resource_dirs[0])
+        # Nothing to write if the file already holds these values
+        if settings == self._saved_settings:
+            return
         
-        if not os.path.exists(settings_dir):
-            os.makedirs(settings_dir)
-            print(f"Created settings directory: {settings_dir}")
-            
-        settings_path = os.path.join(settings_dir, 'settings.json')
+        # Write back to the file the settings were loaded from, else to the first resource directory
+        settings_path = self._settings_path
+        if settings_path is None:
+            settings_dir = _RESOURCE_DIRS[0]
+            try:
+                os.makedirs(settings_dir)
+                _log.debug("Created settings directory: %s", settings_dir)
+            except FileExistsError:
+                pass
+            settings_path = _SETTINGS_PATHS[0]
         
         try:
-            with open(settings_path, 'w') as f:
-                json.dump(settings, f)
-            print(f"Settings saved to: {settings_path}")
-        except Exception as e:
-            print(f"Error saving settings: {e}")
+            # Write a temporary file and rename it over the old one, so a crash never leaves it truncated
+            temp_path = settings_path + '.tmp'
+            encoded = _json_dumps(settings)
+            with open(temp_path, 'wb') as f:
+                f.write(encoded)
+            os.replace(temp_path, settings_path)
+            self._saved_settings = settings
+            self._settings_path = settings_path
+            _log.debug("Settings saved to: %s", settings_path)
+        except Exception:
+            _log.exception("Error saving settings")
     
     def load_settings(self):
         """Load user preferences"""
-        # Get project root directory
-        project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
-        
-        # Check multiple possible resource directories
-        possible_resource_dirs = [
-            os.path.join(project_root, 'resources'),
-            os.path.join(project_root, 'src', 'resources'),
-            os.path.join(project_root, '..', 'resources')
-        ]
-        
-        # Try to find settings file in any of the resource directories
-        settings_path = None
-        for resource_dir in possible_resource_dirs:
-            path = os.path.join(resource_dir, 'settings.json')
-            if os.path.exists(path):
-                settings_path = path
-                break
-        
-        if settings_path:
+        # Open the settings file already in use, else the first one found in the resource directories
+        if self._settings_path is not None:
+            candidates = (self._settings_path,)
+        else:
+            candidates = _SETTINGS_PATHS
+        settings_file = None
+        for settings_path in candidates:
+            try:
+                settings_file = open(settings_path, 'rb')
+            except FileNotFoundError:
+                continue
+            except OSError:
+                # Unreadable (a directory, no permission...): try the next one
+                _log.exception("Error opening settings from: %s", settings_path)
+                continue
+            self._settings_path = settings_path
+            break
+        
+        if settings_file:
             try:
-                print(f"Loading settings from: {settings_path}")
-                with open(settings_path, 'r') as f:
-                    settings = json.load(f)
+                _log.debug("Loading settings from: %s", settings_path)
+                with settings_file as f:
+                    encoded = f.read()
+                settings = _json_loads(encoded)
+                self._saved_settings = settings
                 
                 # Apply settings
                 if "difficulty" in settings:
@@ -1625,41 +1996,23 @@ class GomokuWindow(QMainWindow):
                         self.board.ai_wins, 
                         self.board.draws
                     )
-            except Exception as e:
-                print(f"Error loading settings: {e}")
+            except Exception:
+                _log.exception("Error loading settings")
         else:
-            print("No settings file found, using defaults")
+            _log.debug("No settings file found, using defaults")
     
     def show_about_dialog(self):
         """Show the About dialog"""
-        about_dialog = AboutDialog(self)
-        about_dialog.exec_()
+        if self._about_dialog is None:
+            self._about_dialog = AboutDialog(self)
+        self._about_dialog.exec_()
         
     def show_about(self):
         """Show the About dialog (alias for show_about_dialog)"""
         self.show_about_dialog()
 
 
-class AboutDialog(QDialog):
-    """About dialog showing information about the game"""
-    
-    def __init__(self, parent=None):
-        super().__init__(parent)
-        self.setWindowTitle("About Five in a Row")
-        self.setMinimumWidth(400)
-        
-        layout = QVBoxLayout()
-        
-        # Add game title
-        title = QLabel("Five in a Row (Gomoku)")
-        title.setStyleSheet("font-size: 18px; font-weight: bold;")
-        title.setAlignment(Qt.AlignCenter)
-        layout.addWidget(title)
-        
-        # Add description
-        info = QTextBrowser()
-        info.setOpenExternalLinks(True)
-        info.setHtml("""
+_ABOUT_HTML = """
         <p style='text-align: center;'><b>Version 1.1</b></p>
         <p>Five in a Row (also known as Gomoku or Gobang) is a classic two-player strategy game played on a 15×15 grid. 
         Players take turns placing stones (black and white) on the board, and the first to get exactly 
@@ -1683,7 +2036,29 @@ class AboutDialog(QDialog):
         </ul>
         
         <p style='text-align: center;'>&copy; 2025</p>
-        """)
+        """
+
+
+class AboutDialog(QDialog):
+    """About dialog showing information about the game"""
+    
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.setWindowTitle("About Five in a Row")
+        self.setMinimumWidth(400)
+        
+        layout = QVBoxLayout()
+        
+        # Add game title
+        title = QLabel("Five in a Row (Gomoku)")
+        title.setObjectName("aboutTitle")
+        title.setAlignment(Qt.AlignCenter)
+        layout.addWidget(title)
+        
+        # Add description
+        info = QTextBrowser()
+        info.setOpenExternalLinks(True)
+        info.setHtml(_ABOUT_HTML)
         layout.addWidget(info)
         
         # Add close button
@@ -1694,6 +2069,8 @@ class AboutDialog(QDialog):
         self.setLayout(layout)
 
 def main():
+    # Set GOMOKU_LOG_LEVEL=DEBUG to see settings messages
+    logging.basicConfig(level=os.environ.get('GOMOKU_LOG_LEVEL', 'WARNING').upper())
     app = QApplication(sys.argv)
     window = GomokuWindow()
     sys.exit(app.exec_())
@@ -8,14 +8,48 @@ import os
 import shutil
 import sys
 import subprocess
+from functools import lru_cache
 
+def list_dir_names(directory):
+    """Return the set of names in a directory that os.path.exists would accept, or None if it can't be read."""
+    try:
+        with os.scandir(directory) as entries:
+            return {entry.name for entry in entries
+                    if not entry.is_symlink() or os.path.exists(entry.path)}
+    except OSError:
+        return None
+
+def remove_broken_link(path):
+    """Delete path if it is a symbolic link whose target is gone, so it counts as missing."""
+    if os.path.islink(path) and not os.path.exists(path):
+        os.remove(path)
+
+def link_or_copy(source_path, dest_path):
+    """Link or copy source_path to dest_path; return how it was done, or None if dest exists."""
+    remove_broken_link(dest_path)
+    
+    # Symlinks need developer mode on Windows, where a hard link still works
+    # without copying any data (same volume only)
+    for method, action in (('symlink', os.symlink), ('hardlink', os.link)):
+        try:
+            action(source_path, dest_path)
+            return method
+        except FileExistsError:
+            return None
+        except OSError:
+            pass
+    shutil.copyfile(source_path, dest_path)
+    return 'copy'
+
+@lru_cache(maxsize=1)
 def find_project_root():
     """Find the project root directory based on the current script's location."""
     # Start from script's location
     current_dir = os.path.dirname(os.path.abspath(__file__))
     
     # Look for markers that indicate we're in the project root
-    while current_dir and not os.path.exists(os.path.join(current_dir, 'src')) and not os.path.exists(os.path.join(current_dir, 'build.sh')):
+    # (one directory listing per level rather than a stat per marker)
+    while current_dir and not {'src', 'build.sh'} & (list_dir_names(current_dir) or set()):
         parent = os.path.dirname(current_dir)
         if parent == current_dir:  # We've reached the filesystem root
             return None
@@ -78,14 +112,19 @@ def consolidate_resources():
     found_resources = set()
     
     # First, check if resources already exist in main directory
+    main_entries = list_dir_names(main_resources_dir) or set()
     for filename in resource_files:
-        if os.path.exists(os.path.join(main_resources_dir, filename)):
+        if filename in main_entries:
             found_resources.add(filename)
             print(f"Resource already exists in main directory: {filename}")
     
-    # Look for missing resources in other locations
+    # Look for missing resources in other locations, listing each directory once
+    # instead of stat'ing every candidate file
     for location in resource_locations:
-        if not os.path.exists(location):
+        if len(found_resources) == len(resource_files):
+            break  # Everything found, no need to probe further locations
+        entries = list_dir_names(location)
+        if entries is None:
             continue
         
         print(f"Checking location: {location}")
@@ -94,26 +133,18 @@ def consolidate_resources():
                 continue  # Skip files we've already found
                 
             source_path = os.path.join(location, filename)
-            if os.path.exists(source_path):
+            if filename in entries:
                 dest_path = os.path.join(main_resources_dir, filename)
-                if not os.path.exists(dest_path):
-                    try:
-                        # Try to create symbolic link first
-                        try:
-                            if sys.platform == "win32":
-                                # On Windows, need admin privileges or developer mode enabled
-                                import subprocess
-                                subprocess.call(['mklink', dest_path, source_path], shell=True)
-                            else:
-                                # On Unix systems
-                                os.symlink(source_path, dest_path)
-                            print(f"Created symbolic link from {source_path} to {dest_path}")
-                        except (OSError, subprocess.SubprocessError):
-                            # Fall back to copying if symlink fails
-                            shutil.copyfile(source_path, dest_path)
-                            print(f"Copied {filename} from {location} to {main_resources_dir}")
-                    except Exception as e:
-                        print(f"Error creating link or copying file {filename}: {e}")
+                try:
+                    method = link_or_copy(source_path, dest_path)
+                    if method == 'symlink':
+                        print(f"Created symbolic link from {source_path} to {dest_path}")
+                    elif method == 'hardlink':
+                        print(f"Created hard link from {source_path} to {dest_path}")
+                    elif method == 'copy':
+                        print(f"Copied {filename} from {location} to {main_resources_dir}")
+                except Exception as e:
+                    print(f"Error creating link or copying file {filename}: {e}")
                 found_resources.add(filename)
     
     # Generate missing resources if needed
@@ -127,11 +158,20 @@ def consolidate_resources():
             if os.path.exists(create_icon_path):
                 print("Running create_icon.py to generate the game icon...")
                 try:
-                    # Change to project root for proper paths
-                    os.chdir(project_root)
-                    
-                    # Run the script
-                    os.system(f"python3 {create_icon_path}")
+                    # Call the generator in-process rather than paying for a
+                    # second interpreter start-up
+                    frontend_dir = os.path.dirname(create_icon_path)
+                    if frontend_dir not in sys.path:
+                        sys.path.insert(0, frontend_dir)
+                    try:
+                        import create_icon
+                    except ImportError:
+                        # Its dependencies may only be installed for another interpreter
+                        subprocess.call(['python3', create_icon_path], cwd=project_root)
+                    else:
+                        icon_path = os.path.join(main_resources_dir, 'gomoku_icon.png')
+                        remove_broken_link(icon_path)  # don't write through a dead link
+                        create_icon.create_gomoku_icon(512, icon_path)
                 except Exception as e:
                     print(f"Error generating icon: {e}")
     
@@ -8,59 +8,67 @@ This doesn't use any GUI - it just tests the basic functionality of the game eng
 import sys
 import os
 import ctypes
-from ctypes import c_void_p, c_int, POINTER, byref
+from ctypes import c_void_p, c_int, c_int8, POINTER, byref
 import time
 
-def main():
-    print("Five in a Row (Gomoku) Backend Test")
-    print("-----------------------------------")
+# Paths resolved once at import time
+_FRONTEND_DIR = os.path.dirname(os.path.abspath(__file__))
+_PROJECT_ROOT = os.path.dirname(os.path.dirname(_FRONTEND_DIR))
+
+# Places the shared library may have been built to, in order of preference
+if sys.platform.startswith('darwin'):  # macOS
+    _LIB_CANDIDATES = [
+        os.path.join(_FRONTEND_DIR, '../lib/libgomoku.dylib'),
+        os.path.join(_PROJECT_ROOT, 'lib/libgomoku.dylib'),
+        os.path.join(_PROJECT_ROOT, 'build/libgomoku.dylib')
+    ]
+elif sys.platform.startswith('linux'):  # Linux
+    _LIB_CANDIDATES = [
+        os.path.join(_FRONTEND_DIR, '../lib/libgomoku.so'),
+        os.path.join(_PROJECT_ROOT, 'lib/libgomoku.so'),
+        os.path.join(_PROJECT_ROOT, 'build/libgomoku.so')
+    ]
+elif sys.platform.startswith('win'):  # Windows
+    _LIB_CANDIDATES = [
+        os.path.join(_FRONTEND_DIR, '../lib/gomoku.dll'),
+        os.path.join(_PROJECT_ROOT, 'lib/gomoku.dll'),
+        os.path.join(_PROJECT_ROOT, 'build/Release/gomoku.dll'),
+        os.path.join(_PROJECT_ROOT, 'build/gomoku.dll')
+    ]
+else:
+    _LIB_CANDIDATES = None
+
+# Library handle, loaded and prototyped once per process
+_LIB = None
+
+def _setup_prototypes(lib):
+    """Declare the argument and return types of the backend functions."""
+    lib.create_engine.restype = c_void_p
+    lib.destroy_engine.argtypes = [c_void_p]
+    lib.reset_game.argtypes = [c_void_p]
+    lib.make_move.argtypes = [c_void_p, c_int, c_int, c_int]
+    lib.make_move.restype = c_int
+    lib.get_best_move.argtypes = [c_void_p, POINTER(c_int), POINTER(c_int)]
+    lib.is_game_over.argtypes = [c_void_p]
+    lib.is_game_over.restype = c_int
+    lib.get_winner.argtypes = [c_void_p]
+    lib.get_winner.restype = c_int
+    lib.get_board_value.argtypes = [c_void_p, c_int, c_int]
+    lib.get_board_value.restype = c_int
+    lib.get_board.argtypes = [c_void_p, POINTER(c_int8)]
+    lib.get_board.restype = None
+
+def _get_lib():
+    """Load the backend library on first use and return the cached handle, or None on failure."""
+    global _LIB
+    if _LIB is not None:
+        return _LIB
     
-    # Load the shared library
-    if sys.platform.startswith('darwin'):  # macOS
-        # Try several possible library locations
-        possible_paths = [
-            os.path.join(os.path.dirname(os.path.abspath(__file__)), '../lib/libgomoku.dylib'),
-            os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))), 'lib/libgomoku.dylib'),
-            os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))), 'build/libgomoku.dylib')
-        ]
-        lib_path = None
-        for path in possible_paths:
-            if os.path.exists(path):
-                lib_path = path
-                break
-        if not lib_path:
-            lib_path = possible_paths[0]  # Default path for error reporting
-    elif sys.platform.startswith('linux'):  # Linux
-        # Try several possible library locations
-        possible_paths = [
-            os.path.join(os.path.dirname(os.path.abspath(__file__)), '../lib/libgomoku.so'),
-            os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))), 'lib/libgomoku.so'),
-            os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))), 'build/libgomoku.so')
-        ]
-        lib_path = None
-        for path in possible_paths:
-            if os.path.exists(path):
-                lib_path = path
-                break
-        if not lib_path:
-            lib_path = possible_paths[0]  # Default path for error reporting
-    elif sys.platform.startswith('win'):  # Windows
-        # Try several possible library locations
-        possible_paths = [
-            os.path.join(os.path.dirname(os.path.abspath(__file__)), '../lib/gomoku.dll'),
-            os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))), 'lib/gomoku.dll'),
-            os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))), 'build/Release/gomoku.dll'),
-            os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))), 'build/gomoku.dll')
-        ]
-        lib_path = None
-        for path in possible_paths:
-            if os.path.exists(path):
-                lib_path = path
-                break
-        if not lib_path:
-            lib_path = possible_paths[0]  # Default path for error reporting
-    else:
+    # Load the shared library from the first candidate location that exists
+    if _LIB_CANDIDATES is None:
         raise OSError("Unsupported platform")
+    lib_path = next((path for path in _LIB_CANDIDATES if os.path.exists(path)),
+                    _LIB_CANDIDATES[0])  # Default path for error reporting
     
     print(f"Loading library from: {lib_path}")
     try:
@@ -70,18 +78,15 @@ def main():
         print(f"Error loading library: {e}")
         print("\nTrying alternative locations...")
         
-        # Get project root directory
-        project_root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-        
         # Try build directory
         if sys.platform.startswith('darwin'):
-            alt_path = os.path.join(project_root, 'build', 'libgomoku.dylib')
+            alt_path = os.path.join(_PROJECT_ROOT, 'build', 'libgomoku.dylib')
         elif sys.platform.startswith('linux'):
-            alt_path = os.path.join(project_root, 'build', 'libgomoku.so')
+            alt_path = os.path.join(_PROJECT_ROOT, 'build', 'libgomoku.so')
         else:  # Windows
-            alt_path = os.path.join(project_root, 'build', 'gomoku.dll')
+            alt_path = os.path.join(_PROJECT_ROOT, 'build', 'gomoku.dll')
             if not os.path.exists(alt_path):
-                alt_path = os.path.join(project_root, 'build', 'Release', 'gomoku.dll')
+                alt_path = os.path.join(_PROJECT_ROOT, 'build', 'Release', 'gomoku.dll')
         
         print(f"Trying: {alt_path}")
         try:
@@ -89,8 +94,20 @@ def main():
             print("Library loaded from alternative location!")
         except OSError as e2:
             print(f"Error loading from alternative location: {e2}")
-            print("\nMake sure you've built the C++ backend by running build.sh or build.bat")
-            return 1
+            return None
+    
+    _setup_prototypes(lib)
+    _LIB = lib
+    return lib
+
+def main():
+    print("Five in a Row (Gomoku) Backend Test")
+    print("-----------------------------------")
+    
+    lib = _get_lib()
+    if lib is None:
+        print("\nMake sure you've built the C++ backend by running build.sh or build.bat")
+        return 1
     
     # Define constants
     EMPTY = 0
@@ -98,20 +115,6 @@ def main():
     AI = 2
     BOARD_SIZE = 15
     
-    # Define function prototypes
-    lib.create_engine.restype = c_void_p
-    lib.destroy_engine.argtypes = [c_void_p]
-    lib.reset_game.argtypes = [c_void_p]
-    lib.make_move.argtypes = [c_void_p, c_int, c_int, c_int]
-    lib.make_move.restype = c_int
-    lib.get_best_move.argtypes = [c_void_p, POINTER(c_int), POINTER(c_int)]
-    lib.is_game_over.argtypes = [c_void_p]
-    lib.is_game_over.restype = c_int
-    lib.get_winner.argtypes = [c_void_p]
-    lib.get_winner.restype = c_int
-    lib.get_board_value.argtypes = [c_void_p, c_int, c_int]
-    lib.get_board_value.restype = c_int
-    
     # Create an engine instance
     print("Creating engine...")
     engine = lib.create_engine()
@@ -143,17 +146,13 @@ def main():
     
     # Print the board
     print("\nCurrent board state:")
-    for i in range(BOARD_SIZE):
-        row_str = ""
-        for j in range(BOARD_SIZE):
-            value = lib.get_board_value(engine, i, j)
-            if value == EMPTY:
-                row_str += ". "
-            elif value == PLAYER:
-                row_str += "X "
-            elif value == AI:
-                row_str += "O "
-        print(row_str)
+    # Fetch the whole board in one call rather than one get_board_value per cell
+    board_buf = (c_int8 * (BOARD_SIZE * BOARD_SIZE))()
+    lib.get_board(engine, board_buf)
+    board = bytes(board_buf)
+    symbols = {EMPTY: ". ", PLAYER: "X ", AI: "O "}
+    for i in range(0, len(board), BOARD_SIZE):
+        print("".join(symbols.get(value, "") for value in board[i:i + BOARD_SIZE]))
     
     # Check game status
     game_over = lib.is_game_over(engine)
@@ -0,0 +1,48 @@
+#!/usr/bin/env python3
+
+"""
+Tests for loading settings.json when a candidate path can't be read.
+Run with: python3 -m unittest src/frontend/test_settings.py
+"""
+
+import os
+import sys
+import tempfile
+import unittest
+from types import SimpleNamespace
+from unittest import mock
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import gomoku_app
+from gomoku_app import GomokuWindow
+
+
+class LoadSettingsTest(unittest.TestCase):
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self._tmp.cleanup)
+        # A directory where settings.json should be makes open() fail with IsADirectoryError
+        self.unreadable = os.path.join(self._tmp.name, 'unreadable', 'settings.json')
+        os.makedirs(self.unreadable)
+        self.readable = os.path.join(self._tmp.name, 'settings.json')
+        with open(self.readable, 'w') as f:
+            f.write('{}')
+
+    def test_unreadable_path_is_logged_not_raised(self):
+        window = SimpleNamespace(_settings_path=self.unreadable, _saved_settings=None)
+        with self.assertLogs(gomoku_app._log, 'ERROR'):
+            GomokuWindow.load_settings(window)
+        self.assertIsNone(window._saved_settings)
+
+    def test_unreadable_candidate_falls_through_to_next(self):
+        window = SimpleNamespace(_settings_path=None, _saved_settings=None)
+        with mock.patch.object(gomoku_app, '_SETTINGS_PATHS', (self.unreadable, self.readable)):
+            with self.assertLogs(gomoku_app._log, 'ERROR'):
+                GomokuWindow.load_settings(window)
+        self.assertEqual(window._settings_path, self.readable)
+        self.assertEqual(window._saved_settings, {})
+
+
+if __name__ == "__main__":
+    unittest.main()